@@ -1,65 +1,17 @@
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Set once the .env file has been loaded so repeated lookups skip the disk read
+_DOTENV_LOADED = False
 
 class Settings:
     """Application settings and configuration."""
     
-    # API Settings
-    FANZA_API_URL = os.getenv("FANZA_API_URL", "https://api.video.dmm.co.jp/graphql")
-    
-    # Request Settings
-    USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))
-    REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    
-    # Output Settings
-    DEFAULT_OUTPUT_DIR = os.getenv("DEFAULT_OUTPUT_DIR", "")
-    
-    # Output directory template with tags (user can set this)
-    # Available tags: <YEAR>, <ID>, <STUDIO>, <TITLE> 
-    OUTPUT_DIR_TEMPLATE = os.getenv("OUTPUT_DIR_TEMPLATE", "<YEAR>/<ID>")
-
-    # Video file name template
-    OUTPUT_VIDEO_NAME_TEMPLATE = os.getenv("OUTPUT_VIDEO_NAME_TEMPLATE", "<ID><EXT>")
-    
-    # Translation Settings
-    TRANSLATION_ENABLED = os.getenv("TRANSLATION_ENABLED", "false").lower() == "true"
-    TRANSLATION_API_KEY = os.getenv("TRANSLATION_API_KEY", "")
-    TRANSLATION_SERVICE = os.getenv("TRANSLATION_SERVICE", "google")  # google, deepl, etc.
-    TRANSLATION_TARGET_LANG = os.getenv("TRANSLATION_TARGET_LANG", "en")
-    TRANSLATION_SOURCE_LANG = os.getenv("TRANSLATION_SOURCE_LANG", "ja")
-    
-    # Fields to translate (comma-separated)
-    TRANSLATION_FIELDS = os.getenv("TRANSLATION_FIELDS", "title,plot,genres,actresses,directors,studio,label,series").split(",")
-    
-    # Subtitle Download Settings
-    SUBTITLE_DOWNLOAD_ENABLED = os.getenv("SUBTITLE_DOWNLOAD_ENABLED", "true").lower() == "true"
-    SUBTITLE_LANGUAGES = os.getenv("SUBTITLE_LANGUAGES", "en").split(",")  # Preferred languages in order
-    SUBTITLE_FORMAT = os.getenv("SUBTITLE_FORMAT", "srt")  # srt, ass, vtt, etc.
-    SUBTITLE_OUTPUT_DIR = os.getenv("SUBTITLE_OUTPUT_DIR", "")  # Empty for same directory as video
-    SUBTITLE_FILENAME_TEMPLATE = os.getenv("SUBTITLE_FILENAME_TEMPLATE", "<ID>.<LANG>.<EXT>")
-    
-    # Image Download Settings
-    IMAGE_DOWNLOAD_ENABLED = os.getenv("IMAGE_DOWNLOAD_ENABLED", "true").lower() == "true"
-    IMAGE_FILENAME_COVER = os.getenv("IMAGE_FILENAME_COVER", "fanart")  # fanart.jpg
-    IMAGE_FILENAME_POSTER = os.getenv("IMAGE_FILENAME_POSTER", "folder")  # folder.jpg
-    
-    # Genres to skip (comma-separated)
-    SKIP_GENRES = os.getenv("SKIP_GENRES", "4K,ハイビジョン,独占配信").split(",")
-    
-    # Cache settings
-    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-    CACHE_FILE = os.getenv("CACHE_FILE", "")  # Empty for default location
-    
     # Multi-Scraper Settings
     ENABLED_SCRAPERS = ['r18dev', 'fanza']
 
-    # R18.dev Language Settings
-    R18DEV_LANGUAGE = os.getenv("R18DEV_LANGUAGE", "en")  # "en" | "jp"
-    
     # Field Priority Settings - which scraper to prefer for each field
     # Format: list of scrapers in order of preference
     FIELD_PRIORITY_TITLE = ['r18dev', 'fanza']
@@ -75,19 +27,17 @@ class Settings:
     FIELD_PRIORITY_POSTER = ['fanza', 'r18dev']
     FIELD_PRIORITY_GALLERY = ['r18dev', 'fanza']
     
-    # Scraper merge strategy: 'priority' (use first available) or 'merge' (combine data)
-    SCRAPER_MERGE_STRATEGY = os.getenv("SCRAPER_MERGE_STRATEGY", "priority")
-    
     # Required Fields Validation
     # Fields that must be present in metadata for processing to continue
     # If any of these fields are missing or empty, the video file will be skipped
     REQUIRED_FIELDS = ['id', 'title', 'year']
-    REQUIRED_FIELDS_ENABLED = os.getenv("REQUIRED_FIELDS_ENABLED", "true").lower() == "true"
     
     # File Patterns
     #JAV_CODE_PATTERN = r'[A-Za-z]{2,6}[-]?\d{3,5}'
     JAV_CODE_PATTERN = r'[A-Za-z0-9]{2,6}-?\d{3,5}'
-    VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mkv', '.wmv', '.mov']
+    # Compiled once; codes are ASCII so skip Unicode-aware matching
+    JAV_CODE_REGEX = re.compile(JAV_CODE_PATTERN, re.IGNORECASE | re.ASCII)
+    VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.wmv', '.mov'})
     
     # NFO Template Settings
     NFO_TEMPLATE = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -117,5 +67,94 @@ class Settings:
     </fanart>
 </movie>"""
 
+    def __init__(self):
+        """Read environment-backed settings once per instance."""
+        # API Settings
+        self.FANZA_API_URL = os.getenv("FANZA_API_URL", "https://api.video.dmm.co.jp/graphql")
+
+        # Request Settings
+        self.USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        self.REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))  # Fallback for hosts not in REQUEST_RATES
+        # Requests per second per host (comma-separated host=rate pairs)
+        self.REQUEST_RATES = {
+            host.strip(): float(rate)
+            for host, _, rate in (
+                item.partition("=")
+                for item in os.getenv("REQUEST_RATES", "api.video.dmm.co.jp=1.0,r18.dev=2.0,translate.googleapis.com=2.0,api-free.deepl.com=2.0").split(",")
+            )
+            if host.strip() and rate.strip()
+        }
+        self.REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
+
+        # Output Settings
+        self.DEFAULT_OUTPUT_DIR = os.getenv("DEFAULT_OUTPUT_DIR", "")
+
+        # Output directory template with tags (user can set this)
+        # Available tags: <YEAR>, <ID>, <STUDIO>, <TITLE> 
+        self.OUTPUT_DIR_TEMPLATE = os.getenv("OUTPUT_DIR_TEMPLATE", "<YEAR>/<ID>")
+
+        # Video file name template
+        self.OUTPUT_VIDEO_NAME_TEMPLATE = os.getenv("OUTPUT_VIDEO_NAME_TEMPLATE", "<ID><EXT>")
+
+        # Translation Settings
+        self.TRANSLATION_ENABLED = os.getenv("TRANSLATION_ENABLED", "false").lower() == "true"
+        self.TRANSLATION_API_KEY = os.getenv("TRANSLATION_API_KEY", "")
+        self.TRANSLATION_SERVICE = os.getenv("TRANSLATION_SERVICE", "google")  # google, deepl, etc.
+        self.TRANSLATION_TARGET_LANG = os.getenv("TRANSLATION_TARGET_LANG", "en")
+        self.TRANSLATION_SOURCE_LANG = os.getenv("TRANSLATION_SOURCE_LANG", "ja")
+
+        # Fields to translate (comma-separated)
+        self.TRANSLATION_FIELDS = os.getenv("TRANSLATION_FIELDS", "title,plot,genres,actresses,directors,studio,label,series").split(",")
+
+        # Subtitle Download Settings
+        self.SUBTITLE_DOWNLOAD_ENABLED = os.getenv("SUBTITLE_DOWNLOAD_ENABLED", "true").lower() == "true"
+        self.SUBTITLE_LANGUAGES = os.getenv("SUBTITLE_LANGUAGES", "en").split(",")  # Preferred languages in order
+        self.SUBTITLE_FORMAT = os.getenv("SUBTITLE_FORMAT", "srt")  # srt, ass, vtt, etc.
+        self.SUBTITLE_OUTPUT_DIR = os.getenv("SUBTITLE_OUTPUT_DIR", "")  # Empty for same directory as video
+        self.SUBTITLE_FILENAME_TEMPLATE = os.getenv("SUBTITLE_FILENAME_TEMPLATE", "<ID>.<LANG>.<EXT>")
+
+        # Image Download Settings
+        self.IMAGE_DOWNLOAD_ENABLED = os.getenv("IMAGE_DOWNLOAD_ENABLED", "true").lower() == "true"
+        self.IMAGE_FILENAME_COVER = os.getenv("IMAGE_FILENAME_COVER", "fanart")  # fanart.jpg
+        self.IMAGE_FILENAME_POSTER = os.getenv("IMAGE_FILENAME_POSTER", "folder")  # folder.jpg
+
+        # Genres to skip (comma-separated)
+        self.SKIP_GENRES = frozenset(os.getenv("SKIP_GENRES", "4K,ハイビジョン,独占配信").split(","))
+
+        # Cache settings
+        self.CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+        self.CACHE_FILE = os.getenv("CACHE_FILE", "")  # Empty for default location
+        self.SCRAPER_CACHE_FILE = os.getenv("SCRAPER_CACHE_FILE", "")  # Empty for default location
+        self.SCRAPER_CACHE_REFRESH = False  # Ignore cached scraper results but store fresh ones (--no-cache)
+        self.PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "4"))  # Background scrapes in auto mode (0 = off)
+        self.PROCESS_WORKERS = int(os.getenv("PROCESS_WORKERS", "8"))  # Files processed at once in auto mode (--jobs)
+
+        # R18.dev Language Settings
+        self.R18DEV_LANGUAGE = os.getenv("R18DEV_LANGUAGE", "en")  # "en" | "jp"
+
+        # Scraper merge strategy: 'priority' (use first available), 'merge' (combine data)
+        # or 'first' (take whichever scraper answers first, skipping the wait for the rest)
+        self.SCRAPER_MERGE_STRATEGY = os.getenv("SCRAPER_MERGE_STRATEGY", "priority")
+
+        # Required Fields Validation
+        self.REQUIRED_FIELDS_ENABLED = os.getenv("REQUIRED_FIELDS_ENABLED", "true").lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the application settings, loading the .env file at most once.
+
+    Call ``get_settings.cache_clear()`` to pick up environment changes.
+
+    Returns:
+        Cached Settings instance
+    """
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(override=False)
+        _DOTENV_LOADED = True
+    return Settings()
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,17 +1,17 @@
 """
 Core application module for JAV NFO Generator.
+
+Re-exports the shared objects from their canonical modules so there is a
+single settings definition shared by every entry point. The CLI
+application (``JAVNFOGenerator``) lives in ``main`` and is not imported
+here, so using this package does not pull in the command-line layer.
 """
 
-from .app import JAVNFOGenerator
-from .config import Settings
-from .downloaders import SubtitleDownloader, ImageDownloader
-from .processors import MetadataProcessor, FileProcessor
+from config.settings import Settings, get_settings
+from utils.subtitle_downloader import SubtitleDownloader
 
 __all__ = [
-    'JAVNFOGenerator',
-    'Settings', 
+    'Settings',
+    'get_settings',
     'SubtitleDownloader',
-    'ImageDownloader',
-    'MetadataProcessor',
-    'FileProcessor'
-] 
\ No newline at end of file
+]
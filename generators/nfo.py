@@ -1,15 +1,259 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from config.settings import settings
 from utils.file_utils import FileUtils
+from collections import OrderedDict
+from string import Formatter
+from types import MappingProxyType
+from xml.sax.saxutils import escape as xml_escape
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+import os
 import re
+import threading
+
+# Default value for every field the template may reference
+_DEFAULTS = MappingProxyType({
+    'title': '',
+    'original_title': '',
+    'sort_title': '',
+    'id': '',
+    'content_id': '',
+    'release_date': '',
+    'year': '',
+    'runtime': '',
+    'mpaa': 'XXX',
+    'rating': '',
+    'votes': '',
+    'plot': '',
+    'outline': '',
+    'tagline': '',
+    'series': '',
+    'directors': [],
+    'studio': '',
+    'label': '',
+    'genres': [],
+    'actresses': [],
+    'cover': '',
+    'poster': '',
+    'fanart': ''
+})
+
+# Fields that stay lists instead of being converted to strings
+_LIST_KEYS = frozenset({'directors', 'genres', 'actresses'})
+
+# _DEFAULTS split by field type, so per-call code needs no type branch
+_SCALAR_FIELDS = tuple(key for key in _DEFAULTS if key not in _LIST_KEYS)
+_LIST_FIELDS = tuple(key for key in _DEFAULTS if key in _LIST_KEYS)
+
+# Template fields that _format_uncached always fills with strings
+_STR_TEMPLATE_FIELDS = frozenset(_SCALAR_FIELDS) | {'director_tags', 'genre_tags', 'actor_tags'}
+
+
+# (field, default) pairs for the fields converted to strings
+_SCALAR_DEFAULTS = tuple((key, _DEFAULTS[key]) for key in _SCALAR_FIELDS)
+
+
+def _apply_defaults(metadata: Mapping[str, Any], to_str: Callable[[Any], str]) -> Dict[str, Any]:
+    """
+    Fill in defaults for every template field.
+    
+    Args:
+        metadata: Raw metadata
+        to_str: Converts a present scalar value to its string form
+        
+    Returns:
+        Scalars as strings (default when missing or None), arrays as lists
+        (a fresh empty list when missing or not a list)
+    """
+    get = metadata.get
+    formatted = {key: default if (value := get(key)) is None else to_str(value)
+                 for key, default in _SCALAR_DEFAULTS}
+    formatted.update({key: value if isinstance(value := get(key), list) else []
+                      for key in _LIST_FIELDS})
+    return formatted
+
+# Rendered documents kept per generator, keyed by the template fields
+_FORMAT_CACHE_SIZE = 1024
+_MISSING = object()
+
+# Keeps messages from batch worker threads on separate lines
+_PRINT_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert a value into a hashable key, tagged by type.
+    
+    Values such as 1 and True or 4 and 4.0 compare equal but render
+    differently, so scalars carry their type too.
+    """
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    return (type(value), value)
+
+
+def _format_key(metadata: Dict[str, Any]) -> Optional[tuple]:
+    """
+    Build a cache key from the fields that affect the rendered NFO.
+    
+    Args:
+        metadata: Metadata dictionary
+        
+    Returns:
+        Hashable key, or None if a field value cannot be hashed
+    """
+    # Missing and None scalars render the same, so plain .get is enough for them
+    key = (tuple(_freeze(metadata.get(field)) for field in _SCALAR_FIELDS)
+           + tuple(_freeze(metadata.get(field, _MISSING)) for field in _LIST_FIELDS))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+# (element, field) pairs written by the ElementTree fallback layout
+_BASIC_FIELDS = (
+    ('title', 'title'),
+    ('originaltitle', 'original_title'),
+    ('sorttitle', 'sort_title'),
+    ('id', 'id'),
+    ('releasedate', 'release_date'),
+    ('year', 'year'),
+    ('runtime', 'runtime'),
+    ('mpaa', 'mpaa'),
+    ('studio', 'studio'),
+    ('rating', 'rating'),
+    ('votes', 'votes'),
+    ('plot', 'plot'),
+    ('outline', 'outline'),
+    ('tagline', 'tagline'),
+    ('set', 'series'),
+    ('label', 'label'),
+)
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# HTML markup stripped from scraped plots
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Tag fragments for the array fields, joined by _TAG_SEPARATOR
+_TAG_SEPARATOR = "\n    "
+_DIRECTOR_OPEN, _DIRECTOR_CLOSE = "<director>", "</director>"
+_GENRE_OPEN, _GENRE_CLOSE = "<genre>", "</genre>"
+_ACTOR_ROLE = "actress"
+_ACTOR_OPEN = "<actor>\n        <name>"
+_ACTOR_THUMB = "</name>\n        <role>" + _ACTOR_ROLE + "</role>\n        <thumb>"
+_ACTOR_CLOSE = "</thumb>\n    </actor>"
+
+# Close + separator + open, so a run of tags is built with a single join
+_DIRECTOR_JOIN = _DIRECTOR_CLOSE + _TAG_SEPARATOR + _DIRECTOR_OPEN
+_GENRE_JOIN = _GENRE_CLOSE + _TAG_SEPARATOR + _GENRE_OPEN
+_ACTOR_JOIN = _ACTOR_CLOSE + _TAG_SEPARATOR + _ACTOR_OPEN
+
+
+def _join_tags(open_tag: str, joiner: str, close_tag: str, items: List[Any],
+               convert: Callable[[Any], str]) -> str:
+    """
+    Wrap each item in open/close tags, separated by _TAG_SEPARATOR.
+    
+    Args:
+        open_tag: Fragment placed before the first item
+        joiner: Fragment placed between items
+        close_tag: Fragment placed after the last item
+        items: Raw array values
+        convert: Turns one item into escaped tag contents
+        
+    Returns:
+        Joined tags, or an empty string when there are no items
+    """
+    # Most arrays are empty for some field; skip the map and join entirely
+    if not items:
+        return ""
+    return open_tag + joiner.join(map(convert, items)) + close_tag
+
+
+def _escaped_str(value: Any) -> str:
+    """Convert a value to an XML-escaped string."""
+    return xml_escape(str(value))
+
+
+# typed: 1 and True (or 4 and 4.0) are equal keys but render differently
+@lru_cache(maxsize=8192, typed=True)
+def _actor_block(name: Any, image: Any) -> str:
+    """Build the escaped name/role/thumb contents of one <actor> tag."""
+    return "".join((_escaped_str(name), _ACTOR_THUMB, _escaped_str(image)))
+
+
+def _actor_entry(actress: Dict[str, Any]) -> str:
+    """Build one actor entry; the same actress recurs across a batch, so it is memoized."""
+    return _actor_block(actress['name'], actress.get('image', ''))
+
+
+@lru_cache(maxsize=None)
+def _parse_template(template: str, str_fields: frozenset = frozenset()) -> Optional[Tuple[Tuple[str, Optional[str], Optional[str]], ...]]:
+    """
+    Split a str.format template into literal segments and fields once.
+    
+    Args:
+        template: Template using str.format syntax
+        str_fields: Fields the caller guarantees are already strings; these
+            are joined as-is instead of going through format()
+        
+    Returns:
+        Tuple of (literal, field name, format spec) segments, where the spec is
+        None for fields joined as-is, or None if the template uses conversions,
+        attribute/index lookups or nested specs (left to str.format_map)
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None:
+            if conversion or not field_name.isidentifier() or "{" in (format_spec or ""):
+                return None
+            if not format_spec and field_name in str_fields:
+                format_spec = None
+        segments.append((literal, field_name, format_spec))
+    return tuple(segments)
+
 
 class NFOGenerator:
     """Generator for NFO files."""
     
+    # Shared by all instances; the parsed segments are cached per template
+    template = settings.NFO_TEMPLATE
+    
     def __init__(self):
-        self.template = settings.NFO_TEMPLATE
+        self._format_cache = OrderedDict()
+        self._format_lock = threading.Lock()
+        # Parse the template once instead of on every str.format call
+        self._segments = _parse_template(self.template, _STR_TEMPLATE_FIELDS)
+    
+    def _render(self, values: Dict[str, Any]) -> str:
+        """
+        Render the pre-parsed template.
+        
+        Args:
+            values: Mapping of template field names to values
+            
+        Returns:
+            Rendered template
+            
+        Raises:
+            KeyError: If a template field is missing from values
+        """
+        if self._segments is None:
+            return self.template.format_map(values)
+        parts = []
+        for literal, field_name, format_spec in self._segments:
+            parts.append(literal)
+            if field_name is not None:
+                value = values[field_name]
+                parts.append(value if format_spec is None else format(value, format_spec))
+        return "".join(parts)
     
-    def generate_nfo(self, metadata: Dict[str, Any], filename: str, output_dir: str = ".") -> bool:
+    def generate_nfo(self, metadata: Dict[str, Any], filename: str, output_dir: str = ".",
+                     output_path: Optional[str] = None, overwrite: bool = True) -> bool:
         """
         Generate NFO file from metadata.
         
@@ -17,30 +261,56 @@ class NFOGenerator:
             metadata: Metadata dictionary
             filename: Original video filename
             output_dir: Output directory for NFO file
+            output_path: NFO path already resolved by the caller, skips resolving it again
+            overwrite: Replace an existing NFO file
             
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            FileExistsError: If overwrite is False and the NFO file already exists
         """
         try:
-            # Generate NFO content
-            content = self._format_content(metadata)
-            
-            # Generate output path (pass metadata for tag replacement)
-            output_path = FileUtils.get_output_path(filename, output_dir, metadata)
+            data, output_path = self._render_nfo(metadata, filename, output_dir, output_path)
             
             # Write NFO file
-            if FileUtils.write_nfo_file(content, output_path):
+            if FileUtils.write_nfo_bytes(data, output_path, exclusive=not overwrite):
                 return True
             else:
                 return False
                 
+        except FileExistsError:
+            raise
         except Exception as e:
-            print(f"Error generating NFO file: {e}")
+            with _PRINT_LOCK:
+                print(f"Error generating NFO file: {e}")
             return False
     
+    def _render_nfo(self, metadata: Dict[str, Any], filename: str, output_dir: str,
+                    output_path: Optional[str] = None) -> Tuple[bytes, str]:
+        """
+        Render NFO content and work out where it goes.
+        
+        Args:
+            metadata: Metadata dictionary
+            filename: Original video filename
+            output_dir: Output directory for NFO file
+            output_path: NFO path if already known
+            
+        Returns:
+            Tuple of (UTF-8 encoded content, output path)
+        """
+        # Generate NFO content, already encoded for writing
+        data = self._format_encoded(metadata)
+        
+        # Generate output path (pass metadata for tag replacement)
+        if output_path is None:
+            output_path = FileUtils.get_output_path(filename, output_dir, metadata)
+        return data, output_path
+    
     def _format_content(self, metadata: Dict[str, Any]) -> str:
         """
-        Format metadata into NFO content.
+        Format metadata into NFO content, reusing earlier renders.
 
         Args:
             metadata: Metadata dictionary
@@ -48,98 +318,192 @@ class NFOGenerator:
         Returns:
             Formatted NFO content
         """
-        # Ensure all required fields are present
-        formatted_metadata = self._ensure_required_fields(metadata)
+        return self._format_encoded(metadata).decode("utf-8")
+    
+    def _format_encoded(self, metadata: Dict[str, Any]) -> bytes:
+        """
+        Format metadata into UTF-8 encoded NFO content, reusing earlier renders.
+        
+        The cache holds the encoded bytes, so a hit skips both rendering and
+        encoding and the same buffer is handed straight to the writer.
+
+        Args:
+            metadata: Metadata dictionary
 
-        plot = re.sub(r"<[^>]+>", "", metadata.get('plot', '').replace('<br>', '\n'))
-        formatted_metadata['plot'] = plot
-        formatted_metadata['outline'] = plot[:100].replace('\n', ' ') + '...' if len(plot) > 100 else plot
+        Returns:
+            UTF-8 encoded NFO content
+        """
+        key = _format_key(metadata)
+        if key is None:
+            return self._format_uncached(metadata).encode("utf-8")
+        
+        with self._format_lock:
+            data = self._format_cache.get(key)
+            if data is not None:
+                self._format_cache.move_to_end(key)
+                return data
+        
+        data = self._format_uncached(metadata).encode("utf-8")
+        with self._format_lock:
+            self._format_cache[key] = data
+            if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        return data
+    
+    def _format_uncached(self, metadata: Dict[str, Any]) -> str:
+        """
+        Format metadata into NFO content.
 
-        # Use director, genre and actress arrays
-        directors = metadata.get('directors', [])
-        genres = metadata.get('genres', [])
-        actresses = metadata.get('actresses', [])
+        Args:
+            metadata: Metadata dictionary
 
-        director_tags = '\n    '.join([f"<director>{director}</director>" for director in directors])
-        genre_tags = '\n    '.join([f"<genre>{genre}</genre>" for genre in genres])
-        actor_tags = '\n    '.join([
-            f"<actor>\n        <name>{actress['name']}</name>\n        <role>actress</role>\n        <thumb>{actress.get('image', '')}</thumb>\n    </actor>"
-            for actress in actresses
-        ])
+        Returns:
+            Formatted NFO content
+        """
+        # Ensure all required fields are present, escaping scalar values so
+        # scraped text cannot break the XML
+        formatted_metadata = self._ensure_required_fields(metadata, escape=True)
+
+        plot, outline = self._clean_plot(metadata)
+        formatted_metadata['plot'] = xml_escape(plot)
+        formatted_metadata['outline'] = xml_escape(outline)
 
-        formatted_metadata['director_tags'] = director_tags
-        formatted_metadata['genre_tags'] = genre_tags
-        formatted_metadata['actor_tags'] = actor_tags
+        # Tags come from the defaulted arrays, so non-list values are ignored
+        # instead of being iterated character by character
+        formatted_metadata.update(
+            director_tags=_join_tags(_DIRECTOR_OPEN, _DIRECTOR_JOIN, _DIRECTOR_CLOSE,
+                                     formatted_metadata['directors'], _escaped_str),
+            genre_tags=_join_tags(_GENRE_OPEN, _GENRE_JOIN, _GENRE_CLOSE,
+                                  formatted_metadata['genres'], _escaped_str),
+            actor_tags=_join_tags(_ACTOR_OPEN, _ACTOR_JOIN, _ACTOR_CLOSE,
+                                  formatted_metadata['actresses'], _actor_entry),
+        )
 
         # Format the template
         try:
-            return self.template.format(**formatted_metadata)
+            return self._render(formatted_metadata)
         except KeyError as e:
-            print(f"Missing required field in template: {e}")
+            with _PRINT_LOCK:
+                print(f"Missing required field in template: {e}, using basic NFO layout")
+            return self._format_basic_content(metadata)
     
-    def _ensure_required_fields(self, metadata: Dict[str, Any]) -> Dict[str, str]:
+    @staticmethod
+    def _clean_plot(metadata: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Strip HTML from the plot and derive the outline.
+        
+        Args:
+            metadata: Metadata dictionary
+            
+        Returns:
+            Tuple of (plot, outline)
+        """
+        plot = _HTML_TAG.sub("", metadata.get('plot', '').replace('<br>', '\n'))
+        outline = plot[:100].replace('\n', ' ') + '...' if len(plot) > 100 else plot
+        return plot, outline
+    
+    def _format_basic_content(self, metadata: Dict[str, Any]) -> str:
+        """
+        Build a minimal NFO document with ElementTree.
+        
+        Used when the configured template cannot be rendered. ElementTree
+        handles escaping, so the output is always well-formed XML.
+        
+        Args:
+            metadata: Metadata dictionary
+            
+        Returns:
+            Formatted NFO content
+        """
+        formatted_metadata = self._ensure_required_fields(metadata)
+        formatted_metadata['plot'], formatted_metadata['outline'] = self._clean_plot(metadata)
+        
+        root = ET.Element("movie")
+        for tag, key in _BASIC_FIELDS:
+            ET.SubElement(root, tag).text = formatted_metadata[key]
+        for director in formatted_metadata['directors']:
+            ET.SubElement(root, "director").text = str(director)
+        for genre in formatted_metadata['genres']:
+            ET.SubElement(root, "genre").text = str(genre)
+        for actress in formatted_metadata['actresses']:
+            actor = ET.SubElement(root, "actor")
+            ET.SubElement(actor, "name").text = str(actress.get('name', ''))
+            ET.SubElement(actor, "role").text = _ACTOR_ROLE
+            ET.SubElement(actor, "thumb").text = str(actress.get('image', ''))
+        ET.SubElement(root, "thumb").text = formatted_metadata['poster']
+        fanart = ET.SubElement(root, "fanart")
+        ET.SubElement(fanart, "thumb").text = formatted_metadata['cover']
+        
+        if hasattr(ET, "indent"):  # Python 3.9+
+            ET.indent(root, space="    ")
+        body = ET.tostring(root, encoding="unicode", short_empty_elements=False)
+        return _XML_DECLARATION + body
+    
+    def _ensure_required_fields(self, metadata: Dict[str, Any], escape: bool = False) -> Dict[str, str]:
         """
         Ensure all required fields are present with default values.
         
         Args:
             metadata: Raw metadata
+            escape: Also XML-escape the string values (defaults need no escaping)
             
         Returns:
             Metadata with all required fields
         """
-        defaults = {
-            'title': '',
-            'original_title': '',
-            'sort_title': '',
-            'id': '',
-            'content_id': '',
-            'release_date': '',
-            'year': '',
-            'runtime': '',
-            'mpaa': 'XXX',
-            'rating': '',
-            'votes': '',
-            'plot': '',
-            'outline': '',
-            'tagline': '',
-            'series': '',
-            'directors': [],
-            'studio': '',
-            'label': '',
-            'genres': [],
-            'actresses': [],
-            'cover': '',
-            'poster': '',
-            'fanart': ''
-        }
-        
-        # Convert all values to strings and ensure they exist
-        formatted = {}
-        for key, default_value in defaults.items():
-            value = metadata.get(key, default_value)
-            # Keep arrays as arrays, convert others to strings
-            if key in ['directors', 'genres', 'actresses']:
-                formatted[key] = value if isinstance(value, list) else default_value
-            else:
-                formatted[key] = str(value) if value is not None else default_value
+        # Keep arrays as arrays (fresh list when missing), convert others to strings
+        return _apply_defaults(metadata, _escaped_str if escape else str)
 
-        return formatted
-
-    def generate_batch(self, metadata_list: list, output_dir: str = ".") -> int:
+    def generate_batch(self, metadata_list: list, output_dir: str = ".", max_workers: Optional[int] = None,
+                       overwrite: bool = True) -> int:
         """
-        Generate NFO files for multiple items.
+        Generate NFO files for multiple items in parallel.
         
         Args:
             metadata_list: List of tuples (filename, metadata)
             output_dir: Output directory
+            max_workers: Number of writer threads (default: 4 per CPU, capped at the batch size)
+            overwrite: Replace existing NFO files (otherwise they are skipped)
             
         Returns:
             Number of successfully generated files
         """
+        # Render everything up front so the writes can be issued back to back
+        jobs = []
+        errors = []
+        for filename, metadata in metadata_list:
+            try:
+                jobs.append(self._render_nfo(metadata, filename, output_dir))
+            except Exception as e:
+                errors.append(f"Error generating NFO file: {e}")
+        
         success_count = 0
+        if jobs:
+            # Create each output directory once instead of once per file
+            for directory in {os.path.dirname(path) for _, path in jobs}:
+                if directory:
+                    FileUtils.ensure_directory(directory)
+            
+            if max_workers is None:
+                max_workers = min(len(jobs), (os.cpu_count() or 1) * 4)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(FileUtils.write_nfo_bytes, data, path,
+                                    make_dirs=False, exclusive=not overwrite): path
+                    for data, path in jobs
+                }
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            success_count += 1
+                        else:
+                            errors.append(f"Failed to write NFO file: {futures[future]}")
+                    except FileExistsError:
+                        errors.append(f"NFO file already exists: {futures[future]}")
         
-        for filename, metadata in metadata_list:
-            if self.generate_nfo(metadata, filename, output_dir):
-                success_count += 1
+        # Report failures in one write rather than one print per file
+        if errors:
+            with _PRINT_LOCK:
+                print("\n".join(errors))
         
         return success_count
@@ -5,38 +5,113 @@ JAV NFO Generator - A CLI tool for scraping JAV metadata and generating .nfo fil
 
 import os
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import click
-from colorama import init, Fore, Style
-from tqdm import tqdm
 import shutil
+import threading
+from functools import lru_cache
 
-# Initialize colorama for cross-platform colored output
-init()
+# ANSI colors, only when writing to a terminal that understands them
+_USE_COLOR = sys.stdout.isatty() and os.name != "nt"
+_CYAN = "\x1b[36m" if _USE_COLOR else ""
+_GREEN = "\x1b[32m" if _USE_COLOR else ""
+_MAGENTA = "\x1b[35m" if _USE_COLOR else ""
+_RED = "\x1b[31m" if _USE_COLOR else ""
+_YELLOW = "\x1b[33m" if _USE_COLOR else ""
+_RESET = "\x1b[0m" if _USE_COLOR else ""
+
+# Block shown by _print_metadata, label colors baked in; filled with format_map
+_METADATA_TEMPLATE = "".join(f"{_GREEN}{label}:{_RESET} {{{key}}}\n" for label, key in (
+    ("Id           ", "id"),
+    ("ContentId    ", "content_id"),
+    ("Title        ", "title"),
+    ("OriginalTitle", "original_title"),
+    ("Description  ", "plot"),
+    ("ReleaseYear  ", "year"),
+    ("ReleaseDate  ", "release_date"),
+    ("Runtime      ", "runtime"),
+    ("Rating       ", "rating"),
+    ("Votes        ", "votes"),
+    ("Directors    ", "directors"),
+    ("Studio       ", "studio"),
+    ("Label        ", "label"),
+    ("Series       ", "series"),
+    ("Genres       ", "genres"),
+    ("Actresses    ", "actresses"),
+    ("Cover        ", "cover"),
+    ("Poster       ", "poster"),
+))
+
+
+class _MetadataView(dict):
+    """Metadata mapping for _METADATA_TEMPLATE that shows N/A for missing keys."""
+    
+    def __missing__(self, key):
+        return "N/A"
+
+
+# Files whose artwork may download at the same time in auto mode
+_ARTWORK_WORKERS = 4
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import settings
-from scrapers.factory import ScraperFactory
-from generators.nfo import NFOGenerator
 from utils.pattern import PatternMatcher
 from utils.file_utils import FileUtils
-from utils.translator import Translator
-from utils.cache import translation_cache
-from utils.subtitle_downloader import SubtitleDownloader
-from utils.multi_scraper import MultiScraperManager
-from utils.image_downloader import download_image, crop_image
 
 class JAVNFOGenerator:
     """Main application class for JAV NFO Generator."""
     
     def __init__(self):
-        self.scraper_factory = ScraperFactory()
-        self.multi_scraper = MultiScraperManager()
-        self.nfo_generator = NFOGenerator()
-        self.translator = Translator()
-        self.subtitle_downloader = SubtitleDownloader()
+        # Helpers are created on first use, so commands like `list-scrapers`
+        # or `cache-stats` only import what they need (and `--help` none of it)
+        self._scraper_factory = None
+        self._multi_scraper = None
+        self._nfo_generator = None
+        self._translator = None
+        self._subtitle_downloader = None
+    
+    @property
+    def scraper_factory(self):
+        """Scraper factory, created on first use."""
+        if self._scraper_factory is None:
+            from scrapers.factory import ScraperFactory
+            self._scraper_factory = ScraperFactory()
+        return self._scraper_factory
+    
+    @property
+    def multi_scraper(self):
+        """Multi-scraper manager, created on first use."""
+        if self._multi_scraper is None:
+            from utils.multi_scraper import MultiScraperManager
+            self._multi_scraper = MultiScraperManager()
+        return self._multi_scraper
+    
+    @property
+    def nfo_generator(self):
+        """NFO generator, created on first use."""
+        if self._nfo_generator is None:
+            from generators.nfo import NFOGenerator
+            self._nfo_generator = NFOGenerator()
+        return self._nfo_generator
+    
+    @property
+    def translator(self):
+        """Translator, created on first use (loads the translation cache)."""
+        if self._translator is None:
+            from utils.translator import Translator
+            self._translator = Translator()
+        return self._translator
+    
+    @property
+    def subtitle_downloader(self):
+        """Subtitle downloader, created on first use."""
+        if self._subtitle_downloader is None:
+            from utils.subtitle_downloader import SubtitleDownloader
+            self._subtitle_downloader = SubtitleDownloader()
+        return self._subtitle_downloader
     
     def search_manual(self, jav_id: str, output_dir: str = ".", generate_nfo: bool = False, translate: bool = False) -> bool:
         """
@@ -54,37 +129,35 @@ class JAVNFOGenerator:
         # Normalize and validate JAV ID
         jav_id = PatternMatcher.normalize_jav_code(jav_id)
         if not PatternMatcher.validate_jav_code(jav_id):
-            print(f"{Fore.RED}Invalid JAV ID format: {jav_id}{Style.RESET_ALL}")
+            print(f"{_RED}Invalid JAV ID format: {jav_id}{_RESET}")
             return False
         
-        print(f"{Fore.CYAN}Searching for JAV ID: {jav_id}{Style.RESET_ALL}")
+        print(f"{_CYAN}Searching for JAV ID: {jav_id}{_RESET}")
         
         # Search using multi-scraper system with priorities
         best_result = self.multi_scraper.search_with_priority(jav_id)
         
         if best_result:
-            print(f"{Fore.GREEN}Found metadata for {jav_id}{Style.RESET_ALL}")
+            print(f"{_GREEN}Found metadata for {jav_id}{_RESET}")
             
             # Validate required fields
             is_valid, missing_fields = self._validate_required_fields(best_result)
             if not is_valid:
-                print(f"{Fore.YELLOW}Warning: Missing required fields: {', '.join(missing_fields)}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}Proceeding with available metadata (manual search mode){Style.RESET_ALL}")
+                print(f"{_YELLOW}Warning: Missing required fields: {', '.join(missing_fields)}{_RESET}")
+                print(f"{_YELLOW}Proceeding with available metadata (manual search mode){_RESET}")
             
             if translate:
-                print(f"{Fore.CYAN}Translating metadata...{Style.RESET_ALL}")
+                print(f"{_CYAN}Translating metadata...{_RESET}")
                 best_result = self.translator.translate_metadata(best_result, force_enable=True)
             
             if generate_nfo:
                 # Generate NFO content and output to terminal
                 try:
                     nfo_content = self.nfo_generator._format_content(best_result)
-                    print(f"\n{Fore.CYAN}=== NFO Content ==={Style.RESET_ALL}")
-                    print(nfo_content)
-                    print(f"{Fore.CYAN}=================={Style.RESET_ALL}")
+                    sys.stdout.write(f"\n{_CYAN}=== NFO Content ==={_RESET}\n{nfo_content}\n{_CYAN}=================={_RESET}\n")
                     return True
                 except Exception as e:
-                    print(f"{Fore.RED}Error generating NFO content: {e}{Style.RESET_ALL}")
+                    print(f"{_RED}Error generating NFO content: {e}{_RESET}")
                     return False
             else:
                 # Output metadata to terminal
@@ -95,10 +168,11 @@ class JAVNFOGenerator:
                 
                 return True
         else:
-            print(f"{Fore.YELLOW}No metadata found for {jav_id}{Style.RESET_ALL}")
+            print(f"{_YELLOW}No metadata found for {jav_id}{_RESET}")
             return False
     
-    def search_auto(self, directory: str = ".", output_dir: str = ".", translate: bool = False, max_depth: int = 0) -> int:
+    def search_auto(self, directory: str = ".", output_dir: str = ".", translate: bool = False, max_depth: int = 0,
+                    force: bool = False, jobs: Optional[int] = None) -> int:
         """
         Auto-detect video files and generate NFO files.
         
@@ -107,116 +181,250 @@ class JAVNFOGenerator:
             output_dir: Output directory for NFO files
             translate: Whether to translate metadata
             max_depth: Maximum depth to search subdirectories (0 = current directory only)
+            force: Regenerate NFO files that already exist
+            jobs: Files processed in parallel (default: PROCESS_WORKERS)
             
         Returns:
             Number of successfully processed files
         """
-        print(f"{Fore.CYAN}Scanning directory: {directory}{Style.RESET_ALL}")
+        print(f"{_CYAN}Scanning directory: {directory}{_RESET}")
         
         # Find video files with JAV codes
         video_files = PatternMatcher.find_video_files(directory, max_depth)
         
         if not video_files:
-            print(f"{Fore.YELLOW}No video files with JAV codes found in {directory}{Style.RESET_ALL}")
+            print(f"{_YELLOW}No video files with JAV codes found in {directory}{_RESET}")
             return 0
         
-        print(f"{Fore.CYAN}Found {len(video_files)} video files with JAV codes{Style.RESET_ALL}")
+        print(f"{_CYAN}Found {len(video_files)} video files with JAV codes{_RESET}")
+        
+        existing_files = {}  # NFO directory -> file names, listed once per directory
+        
+        # Scrape upcoming files in the background while earlier ones are
+        # processed; results reach the loop below through the scraper cache
+        prefetches = {}
+        prefetcher = None
+        if settings.CACHE_ENABLED and not settings.SCRAPER_CACHE_REFRESH and settings.PREFETCH_WORKERS > 0:
+            prefetcher = ThreadPoolExecutor(max_workers=settings.PREFETCH_WORKERS)
+            for filename, jav_code in video_files:
+                if jav_code not in prefetches and (force or not self._nfo_exists(filename, output_dir, existing_files)[1]):
+                    prefetches[jav_code] = prefetcher.submit(self.multi_scraper.prefetch, jav_code)
         
-        # Process each file
-        success_count = 0
-        for filename, jav_code in tqdm(video_files, desc="Processing files"):
-            print(f"\n{Fore.CYAN}Processing: {filename} ({jav_code}){Style.RESET_ALL}")
+        try:
+            return self._process_video_files(video_files, directory, output_dir, translate,
+                                             existing_files, prefetches, force, jobs)
+        finally:
+            if prefetcher:
+                for future in prefetches.values():
+                    future.cancel()
+                prefetcher.shutdown(wait=False)
+    
+    def _nfo_exists(self, filename: str, output_dir: str, existing_files: dict) -> Tuple[str, bool]:
+        """
+        Check whether the NFO for a video file has already been generated.
+        
+        Args:
+            filename: Video filename
+            output_dir: Output directory for NFO files
+            existing_files: Cache of NFO directory -> file names, filled as needed
             
-            # Check if NFO already exists
-            nfo_path = FileUtils.get_output_path(filename, output_dir)
-            if FileUtils.file_exists(nfo_path):
-                print(f"{Fore.YELLOW}NFO file already exists: {nfo_path}{Style.RESET_ALL}")
-                continue
+        Returns:
+            Tuple of (NFO path, whether it exists)
+        """
+        nfo_path = FileUtils.get_output_path(filename, output_dir)
+        nfo_dir, nfo_name = os.path.split(nfo_path)
+        if nfo_dir not in existing_files:
+            existing_files[nfo_dir] = FileUtils.list_file_names(nfo_dir, ".nfo")
+        return nfo_path, nfo_name in existing_files[nfo_dir]
+    
+    def _process_video_files(self, video_files: List[Tuple[str, str]], directory: str, output_dir: str,
+                             translate: bool, existing_files: dict, prefetches: dict, force: bool = False,
+                             jobs: Optional[int] = None) -> int:
+        """
+        Generate NFO files for detected video files, several at a time.
+        
+        Args:
+            video_files: List of (filename, jav_code) tuples
+            directory: Directory the video files are in
+            output_dir: Output directory for NFO files
+            translate: Whether to translate metadata
+            existing_files: Cache of NFO directory -> file names
+            prefetches: Background scrapes keyed by JAV code
+            force: Regenerate NFO files that already exist
+            jobs: Files processed in parallel (default: PROCESS_WORKERS)
             
-            # Search for metadata using multi-scraper system
-            best_result = self.multi_scraper.search_with_priority(jav_code)
+        Returns:
+            Number of successfully processed files
+        """
+        from tqdm import tqdm
+        from concurrent.futures import as_completed
+        
+        # Artwork for several files downloads at once; jobs for the same
+        # folder share a lock so folder.jpg/fanart.jpg are never written twice at once.
+        # Leaving the block waits for the last image downloads, even on errors
+        artwork_locks = {}  # NFO directory -> lock
+        with ThreadPoolExecutor(max_workers=_ARTWORK_WORKERS) as artwork_pool, \
+                tqdm(total=len(video_files), desc="Processing files") as progress:
             
-            if best_result:
-                # Validate required fields
-                is_valid, missing_fields = self._validate_required_fields(best_result)
-                if not is_valid:
-                    print(f"{Fore.YELLOW}Skipping {filename}: Missing required fields: {', '.join(missing_fields)}{Style.RESET_ALL}")
-                    continue
+            def process(filename: str, jav_code: str, log) -> bool:
+                """Generate the NFO, artwork, video move and subtitles for one file."""
+                log(f"\n{_CYAN}Processing: {filename} ({jav_code}){_RESET}")
                 
-                # Apply translation if requested
-                if translate:
-                    print(f"{Fore.CYAN}Translating metadata for {filename}...{Style.RESET_ALL}")
-                    best_result = self.translator.translate_metadata(best_result, force_enable=True)
+                # Check if NFO already exists
+                if not force:
+                    nfo_path, nfo_exists = self._nfo_exists(filename, output_dir, existing_files)
+                    if nfo_exists:
+                        log(f"{_YELLOW}NFO file already exists: {nfo_path}{_RESET}")
+                        return False
+                
+                # Wait for this file's background scrape if it has started, so the search
+                # below is a cache hit. One still queued behind the prefetch pool is
+                # cancelled and scraped here instead, so file workers never wait on it
+                prefetch = prefetches.pop(jav_code, None)
+                if prefetch is not None and not prefetch.cancel():
+                    prefetch.result()
                 
-                # Generate NFO file (pass metadata for tag replacement)
-                nfo_success = self.nfo_generator.generate_nfo(best_result, filename, output_dir)
-                if nfo_success:
-                    # Download poster and fanart images to output dir
-                    if settings.IMAGE_DOWNLOAD_ENABLED:
-                        nfo_dir = os.path.dirname(FileUtils.get_output_path(filename, output_dir, best_result))
-                        if not os.path.exists(nfo_dir):
-                            os.makedirs(nfo_dir, exist_ok=True)
+                # Search for metadata using multi-scraper system
+                best_result = self.multi_scraper.search_with_priority(jav_code, log)
+                
+                if best_result:
+                    # Validate required fields
+                    is_valid, missing_fields = self._validate_required_fields(best_result)
+                    if not is_valid:
+                        log(f"{_YELLOW}Skipping {filename}: Missing required fields: {', '.join(missing_fields)}{_RESET}")
+                        return False
+                    
+                    # Apply translation if requested
+                    if translate:
+                        log(f"{_CYAN}Translating metadata for {filename}...{_RESET}")
+                        best_result = self.translator.translate_metadata(best_result, force_enable=True, log=log)
+                    
+                    # Resolve the NFO path and video name once from the final
+                    # metadata; the NFO, images and video all go in one folder
+                    nfo_path, video_output_name = FileUtils.get_output_paths(filename, output_dir, best_result)
+                    try:
+                        # Without --force, create the NFO only if it doesn't exist yet. The
+                        # check above uses the metadata-free path; this one is atomic and
+                        # also catches NFOs in metadata-templated folders
+                        nfo_success = self.nfo_generator.generate_nfo(best_result, filename, output_dir, nfo_path,
+                                                                      overwrite=force)
+                    except FileExistsError:
+                        log(f"{_YELLOW}NFO file already exists: {nfo_path}{_RESET}")
+                        return False
+                    if nfo_success:
+                        # The NFO write already created nfo_dir
+                        nfo_dir = os.path.dirname(nfo_path)
                         
-                        cover_url = best_result.get("cover")
-                        poster_url = best_result.get("poster")
-
-                        cover_ok = download_image(
-                            cover_url, settings.IMAGE_FILENAME_COVER, nfo_dir
-                        )
-                        poster_ok = download_image(
-                            poster_url, settings.IMAGE_FILENAME_POSTER, nfo_dir, poster=True
-                        )
-
-                        if cover_ok and poster_ok:
-                            print(f"{Fore.MAGENTA}Downloaded cover and poster image{Style.RESET_ALL}")
-                        elif cover_ok:
-                            print(f"{Fore.MAGENTA}Downloaded cover image, attempting to create poster...{Style.RESET_ALL}")
-                            try:
-                                cover_ext = os.path.splitext(cover_url)[1] or ".jpg"
-                                poster_ext = os.path.splitext(poster_url)[1] or ".jpg"
-                                cover_path = os.path.join(nfo_dir, f"{settings.IMAGE_FILENAME_COVER}{cover_ext}")
-                                poster_path = os.path.join(nfo_dir, f"{settings.IMAGE_FILENAME_POSTER}{poster_ext}")
-                                if crop_image(cover_path, poster_path):
-                                    print(f"{Fore.GREEN}Successfully created poster from cover image{Style.RESET_ALL}")
-                                else:
-                                    print(f"{Fore.YELLOW}Cropped image too small for poster{Style.RESET_ALL}")
-                            except Exception as e:
-                                print(f"{Fore.RED}Error creating poster from cover: {e}{Style.RESET_ALL}")
-                        elif poster_ok:
-                            print(f"{Fore.MAGENTA}Downloaded poster image{Style.RESET_ALL}")
-                        else:
-                            print(f"{Fore.RED}Failed to download images{Style.RESET_ALL}")
+                        # Download poster and fanart images to output dir in the
+                        # background, overlapping them with later files
+                        if settings.IMAGE_DOWNLOAD_ENABLED:
+                            artwork_lock = artwork_locks.setdefault(nfo_dir, threading.Lock())
+                            artwork_pool.submit(self._download_artwork, best_result, nfo_dir, jav_code,
+                                                progress.write, artwork_lock)
                         
-                    # --- Move video file to output_dir if NFO was generated ---
-                    # Use the same tag replacement as output_dir for the video file name
-                    video_output_name = FileUtils.get_output_video_name(filename, output_dir, best_result)
-                    video_output_path = os.path.join(os.path.dirname(FileUtils.get_output_path(filename, output_dir, best_result)), video_output_name)
-                    try:
-                        shutil.move(os.path.join(directory, filename), video_output_path)
-                        print(f"{Fore.MAGENTA}Moved video file to: {video_output_path}{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.RED}Failed to move video file: {e}{Style.RESET_ALL}")
+                        # --- Move video file to output_dir if NFO was generated ---
+                        video_output_path = os.path.join(nfo_dir, video_output_name)
+                        try:
+                            shutil.move(os.path.join(directory, filename), video_output_path)
+                            log(f"{_MAGENTA}Moved video file to: {video_output_path}{_RESET}")
+                        except Exception as e:
+                            log(f"{_RED}Failed to move video file: {e}{_RESET}")
 
-                    # Download subtitles if enabled in settings
-                    if settings.SUBTITLE_DOWNLOAD_ENABLED:
-                        print(f"{Fore.CYAN}Downloading subtitles for {jav_code}...{Style.RESET_ALL}")
-                        # Get the output video name for subtitle naming
-                        video_output_name = FileUtils.get_output_video_name(filename, output_dir, best_result)
-                        subtitle_files = self.subtitle_downloader.download_subtitles_for_jav(jav_code, output_dir, video_output_name, best_result, force_enable=True)
-                        if subtitle_files:
-                            print(f"{Fore.GREEN}Successfully downloaded {len(subtitle_files)} subtitle files{Style.RESET_ALL}")
-                        else:
-                            print(f"{Fore.YELLOW}No subtitles found for {jav_code}{Style.RESET_ALL}")
-                    
-                    success_count += 1
-                    print(f"{Fore.GREEN}Successfully generated NFO for {filename}{Style.RESET_ALL}")
+                        # Download subtitles if enabled in settings
+                        if settings.SUBTITLE_DOWNLOAD_ENABLED:
+                            log(f"{_CYAN}Downloading subtitles for {jav_code}...{_RESET}")
+                            subtitle_files = self.subtitle_downloader.download_subtitles_for_jav(jav_code, output_dir, video_output_name, best_result, force_enable=True)
+                            if subtitle_files:
+                                log(f"{_GREEN}Successfully downloaded {len(subtitle_files)} subtitle files{_RESET}")
+                            else:
+                                log(f"{_YELLOW}No subtitles found for {jav_code}{_RESET}")
+                        
+                        log(f"{_GREEN}Successfully generated NFO for {filename}{_RESET}")
+                        return True
+                    else:
+                        log(f"{_RED}Failed to generate NFO for {filename}{_RESET}")
                 else:
-                    print(f"{Fore.RED}Failed to generate NFO for {filename}{Style.RESET_ALL}")
+                    log(f"{_YELLOW}No metadata found for {jav_code}{_RESET}")
+                return False
+            
+            def process_buffered(filename: str, jav_code: str) -> bool:
+                # Collect the file's status lines (scraper ones included) and print
+                # them with one tqdm.write: the bar is redrawn once per file instead
+                # of once per line, and parallel files don't interleave
+                lines = []
+                try:
+                    return process(filename, jav_code, lines.append)
+                finally:
+                    progress.write("\n".join(lines))
+            
+            success_count = 0
+            workers = max(1, settings.PROCESS_WORKERS if jobs is None else jobs)
+            if workers == 1:
+                for filename, jav_code in video_files:
+                    progress.set_postfix_str(jav_code)
+                    success_count += process_buffered(filename, jav_code)
+                    progress.update()
             else:
-                print(f"{Fore.YELLOW}No metadata found for {jav_code}{Style.RESET_ALL}")
+                # Create the lazy helpers before the workers race to do it
+                self.multi_scraper
+                self.nfo_generator
+                if translate:
+                    self.translator
+                if settings.SUBTITLE_DOWNLOAD_ENABLED:
+                    self.subtitle_downloader
+                
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(process_buffered, filename, jav_code) for filename, jav_code in video_files]
+                    for future in as_completed(futures):
+                        success_count += future.result()
+                        progress.update()
         
         return success_count
     
+    def _download_artwork(self, metadata: dict, nfo_dir: str, jav_code: str, log,
+                          lock: threading.Lock) -> None:
+        """
+        Download cover and poster images, cropping a poster from the cover if needed.
+        
+        Args:
+            metadata: Metadata with cover and poster URLs
+            nfo_dir: Directory the NFO was written to
+            jav_code: JAV code named in status lines, which may print after later files
+            log: Function used to print status lines
+            lock: Held while writing images into nfo_dir
+        """
+        from utils.image_downloader import download_images, crop_image
+        
+        with lock:
+            cover_url = metadata.get("cover")
+            poster_url = metadata.get("poster")
+
+            # Fetch cover and poster in parallel
+            cover_ok, poster_ok = download_images([
+                (cover_url, settings.IMAGE_FILENAME_COVER, nfo_dir),
+                (poster_url, settings.IMAGE_FILENAME_POSTER, nfo_dir, 300, True),
+            ])
+
+            if cover_ok and poster_ok:
+                log(f"{_MAGENTA}Downloaded cover and poster image for {jav_code}{_RESET}")
+            elif cover_ok:
+                log(f"{_MAGENTA}Downloaded cover image for {jav_code}, attempting to create poster...{_RESET}")
+                try:
+                    cover_ext = os.path.splitext(cover_url)[1] or ".jpg"
+                    poster_ext = os.path.splitext(poster_url)[1] or ".jpg"
+                    cover_path = os.path.join(nfo_dir, f"{settings.IMAGE_FILENAME_COVER}{cover_ext}")
+                    poster_path = os.path.join(nfo_dir, f"{settings.IMAGE_FILENAME_POSTER}{poster_ext}")
+                    if crop_image(cover_path, poster_path):
+                        log(f"{_GREEN}Successfully created poster from cover image for {jav_code}{_RESET}")
+                    else:
+                        log(f"{_YELLOW}Cropped image too small for poster for {jav_code}{_RESET}")
+                except Exception as e:
+                    log(f"{_RED}Error creating poster from cover for {jav_code}: {e}{_RESET}")
+            elif poster_ok:
+                log(f"{_MAGENTA}Downloaded poster image for {jav_code}{_RESET}")
+            else:
+                log(f"{_RED}Failed to download images for {jav_code}{_RESET}")
+    
     def _validate_required_fields(self, metadata: dict) -> tuple[bool, List[str]]:
         """
         Validate that metadata contains all required fields.
@@ -253,22 +461,16 @@ class JAVNFOGenerator:
         Returns:
             Best metadata result or None
         """
-        # Filter out None results
-        valid_results = {k: v for k, v in results.items() if v is not None}
-        
-        if not valid_results:
-            return None
-        
         # For now, return the first valid result
         # In the future, this could implement more sophisticated selection logic
-        return list(valid_results.values())[0]
+        return next((result for result in results.values() if result is not None), None)
     
     def list_scrapers(self) -> None:
         """List available scrapers."""
         scrapers = self.scraper_factory.get_available_scrapers()
-        print(f"{Fore.CYAN}Available scrapers:{Style.RESET_ALL}")
-        for scraper in scrapers:
-            print(f"  - {scraper}")
+        lines = [f"{_CYAN}Available scrapers:{_RESET}"]
+        lines.extend(f"  - {scraper}" for scraper in scrapers)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _print_metadata(self, metadata: dict) -> None:
         """
@@ -277,42 +479,23 @@ class JAVNFOGenerator:
         Args:
             metadata: Metadata dictionary to print
         """
-        print(f"\n{Fore.CYAN}=== Metadata ==={Style.RESET_ALL}")
-        
-        # Basic info
-        print(f"{Fore.GREEN}Id           :{Style.RESET_ALL} {metadata.get('id', 'N/A')}")
-        print(f"{Fore.GREEN}ContentId    :{Style.RESET_ALL} {metadata.get('content_id', 'N/A')}")
-        print(f"{Fore.GREEN}Title        :{Style.RESET_ALL} {metadata.get('title', 'N/A')}")
-        print(f"{Fore.GREEN}OriginalTitle:{Style.RESET_ALL} {metadata.get('original_title', 'N/A')}")
-        print(f"{Fore.GREEN}Description  :{Style.RESET_ALL} {metadata.get('plot', 'N/A')}")
-        print(f"{Fore.GREEN}ReleaseYear  :{Style.RESET_ALL} {metadata.get('year', 'N/A')}")
-        print(f"{Fore.GREEN}ReleaseDate  :{Style.RESET_ALL} {metadata.get('release_date', 'N/A')}")
-        print(f"{Fore.GREEN}Runtime      :{Style.RESET_ALL} {metadata.get('runtime', 'N/A')}")
-        print(f"{Fore.GREEN}Rating       :{Style.RESET_ALL} {metadata.get('rating', 'N/A')}")
-        print(f"{Fore.GREEN}Votes        :{Style.RESET_ALL} {metadata.get('votes', 'N/A')}")
-        
-        print(f"{Fore.GREEN}Directors    :{Style.RESET_ALL} {metadata.get('directors', 'N/A')}")
-        print(f"{Fore.GREEN}Studio       :{Style.RESET_ALL} {metadata.get('studio', 'N/A')}")
-        print(f"{Fore.GREEN}Label        :{Style.RESET_ALL} {metadata.get('label', 'N/A')}")
-        print(f"{Fore.GREEN}Series       :{Style.RESET_ALL} {metadata.get('series', 'N/A')}")
-        
-        print(f"{Fore.GREEN}Genres       :{Style.RESET_ALL} {metadata.get('genres', 'N/A')}")
-        print(f"{Fore.GREEN}Actresses    :{Style.RESET_ALL} {metadata.get('actresses', 'N/A')}")
+        lines = [f"\n{_CYAN}=== Metadata ==={_RESET}",
+                 _METADATA_TEMPLATE.format_map(_MetadataView(metadata)).rstrip("\n")]
         
         # Images
-        print(f"{Fore.GREEN}Cover        :{Style.RESET_ALL} {metadata.get('cover', 'N/A')}")
-        print(f"{Fore.GREEN}Poster       :{Style.RESET_ALL} {metadata.get('poster', 'N/A')}")
         gallery = metadata.get("gallery", [])
         if gallery:
-            print(f"{Fore.GREEN}Gallery      :{Style.RESET_ALL}")
-            for i, img in enumerate(gallery[:3], 1):
-                print(f"   [{i}] {img}")
+            lines.append(f"{_GREEN}Gallery      :{_RESET}")
+            lines.extend(f"   [{i}] {img}" for i, img in enumerate(gallery[:3], 1))
             if len(gallery) > 3:
-                print(f"   ... and {len(gallery) - 3} more")
+                lines.append(f"   ... and {len(gallery) - 3} more")
         else:
-            print(f"{Fore.GREEN}Gallery      :{Style.RESET_ALL} N/A")
+            lines.append(f"{_GREEN}Gallery      :{_RESET} N/A")
+        
+        lines.append(f"{_CYAN}================{_RESET}\n\n")
         
-        print(f"{Fore.CYAN}================{Style.RESET_ALL}\n")
+        # One write for the whole block instead of a print per line
+        sys.stdout.write("\n".join(lines))
     
     def test_scraper(self, scraper_name: str, jav_code: str) -> None:
         """
@@ -322,43 +505,59 @@ class JAVNFOGenerator:
             scraper_name: Name of the scraper to test
             jav_code: JAV code to test with
         """
-        scraper = self.scraper_factory.create_scraper(scraper_name)
+        scraper = self.scraper_factory.get_scraper(scraper_name)
         if not scraper:
-            print(f"{Fore.RED}Scraper '{scraper_name}' not found{Style.RESET_ALL}")
+            print(f"{_RED}Scraper '{scraper_name}' not found{_RESET}")
             return
         
-        print(f"{Fore.CYAN}Testing {scraper_name} scraper with {jav_code}{Style.RESET_ALL}")
+        print(f"{_CYAN}Testing {scraper_name} scraper with {jav_code}{_RESET}")
         
         result = scraper.search(jav_code)
         if result:
-            print(f"{Fore.GREEN}Success! Found metadata:{Style.RESET_ALL}")
-            print(f"  Title: {result.get('title', 'N/A')}")
-            print(f"  Actress: {result.get('actress', 'N/A')}")
-            print(f"  Runtime: {result.get('runtime', 'N/A')}")
-            print(f"  Year: {result.get('year', 'N/A')}")
+            sys.stdout.write(
+                f"{_GREEN}Success! Found metadata:{_RESET}\n"
+                f"  Title: {result.get('title', 'N/A')}\n"
+                f"  Actress: {result.get('actress', 'N/A')}\n"
+                f"  Runtime: {result.get('runtime', 'N/A')}\n"
+                f"  Year: {result.get('year', 'N/A')}\n"
+            )
         else:
-            print(f"{Fore.YELLOW}No metadata found{Style.RESET_ALL}")
+            print(f"{_YELLOW}No metadata found{_RESET}")
     
     def show_cache_stats(self) -> None:
         """Show translation cache statistics."""
+        from utils.cache import translation_cache
+        from utils.scraper_cache import scraper_cache
         stats = translation_cache.get_cache_stats()
-        print(f"{Fore.CYAN}=== Translation Cache Statistics ==={Style.RESET_ALL}")
-        for field_type, count in stats.items():
-            print(f"{Fore.GREEN}{field_type}:{Style.RESET_ALL} {count} entries")
-        print(f"{Fore.CYAN}===================================={Style.RESET_ALL}")
+        lines = [f"{_CYAN}=== Translation Cache Statistics ==={_RESET}"]
+        lines.extend(f"{_GREEN}{field_type}:{_RESET} {count} entries" for field_type, count in stats.items())
+        lines.append(f"{_CYAN}=== Scraper Cache Statistics ==={_RESET}")
+        lines.extend(f"{_GREEN}{scraper_name}:{_RESET} {count} entries"
+                     for scraper_name, count in scraper_cache.get_cache_stats().items())
+        lines.append(f"{_CYAN}===================================={_RESET}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def clear_cache(self, field_type: str = None) -> None:
         """
-        Clear translation cache.
+        Clear translation and scraper caches.
         
         Args:
-            field_type: Specific field type to clear (None for all)
+            field_type: Specific field type to clear, "scrapers" for scraper
+                results only (None for all)
         """
+        from utils.cache import translation_cache
+        from utils.scraper_cache import scraper_cache
+        if field_type == "scrapers":
+            scraper_cache.clear_cache()
+            print(f"{_GREEN}Cleared scraper cache{_RESET}")
+            return
+        
         translation_cache.clear_cache(field_type)
         if field_type:
-            print(f"{Fore.GREEN}Cleared cache for {field_type}{Style.RESET_ALL}")
+            print(f"{_GREEN}Cleared cache for {field_type}{_RESET}")
         else:
-            print(f"{Fore.GREEN}Cleared all translation cache{Style.RESET_ALL}")
+            scraper_cache.clear_cache()
+            print(f"{_GREEN}Cleared all translation and scraper cache{_RESET}")
     
     def export_cache(self, output_file: str) -> None:
         """
@@ -367,8 +566,9 @@ class JAVNFOGenerator:
         Args:
             output_file: Output file path
         """
+        from utils.cache import translation_cache
         translation_cache.export_cache(output_file)
-        print(f"{Fore.GREEN}Exported cache to {output_file}{Style.RESET_ALL}")
+        print(f"{_GREEN}Exported cache to {output_file}{_RESET}")
     
     def import_cache(self, input_file: str) -> None:
         """
@@ -377,8 +577,19 @@ class JAVNFOGenerator:
         Args:
             input_file: Input file path
         """
+        from utils.cache import translation_cache
         translation_cache.import_cache(input_file)
-        print(f"{Fore.GREEN}Imported cache from {input_file}{Style.RESET_ALL}")
+        print(f"{_GREEN}Imported cache from {input_file}{_RESET}")
+
+@lru_cache(maxsize=1)
+def get_app() -> JAVNFOGenerator:
+    """
+    Get the shared application instance, creating it on first use.
+    
+    Returns:
+        JAVNFOGenerator instance
+    """
+    return JAVNFOGenerator()
 
 # CLI Commands
 @click.group()
@@ -392,9 +603,11 @@ def cli():
 @click.option('--output', '-o', default='.', help='Output directory for NFO files')
 @click.option('--nfo', is_flag=True, help='Outputs metadata in NFO format')
 @click.option('--translate', '-t', is_flag=True, help='Translate metadata to English')
-def search(id, output, nfo, translate):
+@click.option('--no-cache', is_flag=True, help='Ignore cached scraper results and fetch fresh metadata')
+def search(id, output, nfo, translate, no_cache):
     """Search for metadata using a specific JAV ID or content ID. Outputs to terminal by default, use --nfo to generate NFO file."""
-    app = JAVNFOGenerator()
+    settings.SCRAPER_CACHE_REFRESH = no_cache
+    app = get_app()
     success = app.search_manual(id, output, generate_nfo=nfo, translate=translate)
     sys.exit(0 if success else 1)
 
@@ -403,11 +616,15 @@ def search(id, output, nfo, translate):
 @click.option('--output', '-o', default='.', help='Output directory for NFO files')
 @click.option('--translate', '-t', is_flag=True, help='Translate metadata to English')
 @click.option('--depth', default=0, help='Maximum depth to search subdirectories (0 = current directory only)')
-def auto(directory, output, translate, depth):
+@click.option('--no-cache', is_flag=True, help='Ignore cached scraper results and fetch fresh metadata')
+@click.option('--force', '-F', is_flag=True, help='Regenerate NFO files that already exist')
+@click.option('--jobs', '-j', type=int, default=None, help='Files to process in parallel (default: PROCESS_WORKERS)')
+def auto(directory, output, translate, depth, no_cache, force, jobs):
     """Auto-detect video files and generate NFO files."""
-    app = JAVNFOGenerator()
-    success_count = app.search_auto(directory, output, translate, max_depth=depth)
-    print(f"\n{Fore.GREEN}Successfully processed {success_count} files{Style.RESET_ALL}")
+    settings.SCRAPER_CACHE_REFRESH = no_cache
+    app = get_app()
+    success_count = app.search_auto(directory, output, translate, max_depth=depth, force=force, jobs=jobs)
+    print(f"\n{_GREEN}Successfully processed {success_count} files{_RESET}")
     sys.exit(0 if success_count > 0 else 1)
 
 @cli.command()
@@ -415,17 +632,21 @@ def auto(directory, output, translate, depth):
 @click.option('--output', '-o', default='.', help='Output directory for NFO files')
 @click.option('--translate', '-t', is_flag=True, help='Translate metadata to English')
 @click.option('--depth', default=0, help='Maximum depth to search subdirectories (0 = current directory only)')
-def batch(directory, output, translate, depth):
+@click.option('--no-cache', is_flag=True, help='Ignore cached scraper results and fetch fresh metadata')
+@click.option('--force', '-F', is_flag=True, help='Regenerate NFO files that already exist')
+@click.option('--jobs', '-j', type=int, default=None, help='Files to process in parallel (default: PROCESS_WORKERS)')
+def batch(directory, output, translate, depth, no_cache, force, jobs):
     """Process multiple directories in batch mode."""
-    app = JAVNFOGenerator()
-    success_count = app.search_auto(directory, output, translate, max_depth=depth)
-    print(f"\n{Fore.GREEN}Successfully processed {success_count} files{Style.RESET_ALL}")
+    settings.SCRAPER_CACHE_REFRESH = no_cache
+    app = get_app()
+    success_count = app.search_auto(directory, output, translate, max_depth=depth, force=force, jobs=jobs)
+    print(f"\n{_GREEN}Successfully processed {success_count} files{_RESET}")
     sys.exit(0 if success_count > 0 else 1)
 
 @cli.command()
 def list_scrapers():
     """List available scrapers."""
-    app = JAVNFOGenerator()
+    app = get_app()
     app.list_scrapers()
 
 @cli.command()
@@ -433,34 +654,34 @@ def list_scrapers():
 @click.option('--id', '-i', required=True, help='JAV ID to test with')
 def test(scraper, id):
     """Test a specific scraper."""
-    app = JAVNFOGenerator()
+    app = get_app()
     app.test_scraper(scraper, id)
 
 @cli.command()
 def cache_stats():
     """Show translation cache statistics."""
-    app = JAVNFOGenerator()
+    app = get_app()
     app.show_cache_stats()
 
 @cli.command()
-@click.option('--field', '-f', help='Specific field type to clear (genres, actress, director, etc.)')
+@click.option('--field', '-f', help='Specific field type to clear (genres, actress, director, etc.), or "scrapers" for cached scraper results')
 def clear_cache(field):
-    """Clear translation cache."""
-    app = JAVNFOGenerator()
+    """Clear translation and scraper caches."""
+    app = get_app()
     app.clear_cache(field)
 
 @cli.command()
 @click.option('--output', '-o', required=True, help='Output file path')
 def export_cache(output):
     """Export translation cache to file."""
-    app = JAVNFOGenerator()
+    app = get_app()
     app.export_cache(output)
 
 @cli.command()
 @click.option('--input', '-i', required=True, help='Input file path')
 def import_cache(input):
     """Import translation cache from file."""
-    app = JAVNFOGenerator()
+    app = get_app()
     app.import_cache(input)
 
 if __name__ == '__main__':
@@ -1,17 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Any
-import time
+from urllib.parse import urlparse
+import asyncio
+import json
 import requests
 from config.settings import settings
+from utils.http_session import http_session
+from utils.rate_limiter import rate_limiter
+
+try:
+    import orjson  # Optional: faster parsing of API responses
+except ImportError:
+    orjson = None
 
 class BaseScraper(ABC):
     """Base class for all scrapers."""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': settings.USER_AGENT
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the scraper.
+        
+        Args:
+            session: HTTP session to use (default: the shared pooled session)
+        """
+        self.session = session or http_session
     
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
         """
@@ -30,17 +42,48 @@ class BaseScraper(ABC):
             if 'timeout' not in kwargs:
                 kwargs['timeout'] = settings.REQUEST_TIMEOUT
             
+            # Rate limiting, per host so different sites don't wait on each other
+            rate_limiter.acquire(urlparse(url).hostname)
+            
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             
-            # Rate limiting
-            time.sleep(settings.REQUEST_DELAY)
-            
             return response
         except requests.exceptions.RequestException as e:
             print(f"Request failed: {e}")
             return None
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """
+        Parse a JSON response body, with orjson when it is installed.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Parsed JSON data
+            
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
+    
+    @staticmethod
+    def _release_year(release_date: str) -> str:
+        """
+        Get the year from a YYYY-MM-DD release date.
+        
+        Args:
+            release_date: Release date (may be empty)
+            
+        Returns:
+            Year part, or '' if there is no date
+        """
+        return release_date.partition('-')[0]
+    
     @abstractmethod
     def search(self, jav_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -54,6 +97,22 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def search_async(self, jav_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Search for metadata by JAV code without blocking the event loop.
+        
+        The default implementation runs the blocking search in the loop's
+        thread pool so several scrapers can be awaited concurrently.
+        
+        Args:
+            jav_code: The JAV code to search for
+            
+        Returns:
+            Dictionary with metadata or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.search, jav_code)
+    
     @abstractmethod
     def get_name(self) -> str:
         """
@@ -64,6 +123,18 @@ class BaseScraper(ABC):
         """
         pass
     
+    def cache_key(self) -> str:
+        """
+        Get the name results are cached under in the scraper cache.
+        
+        Scrapers whose formatted output depends on settings should include
+        those settings, so changing them does not serve stale results.
+        
+        Returns:
+            Cache key (default: the scraper name)
+        """
+        return self.get_name()
+    
     def format_metadata(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Format raw metadata into standard format.
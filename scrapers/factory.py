@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import threading
 from .base import BaseScraper
 from .fanza import FanzaScraper
 from .r18dev import R18DevScraper
@@ -11,6 +14,11 @@ class ScraperFactory:
         'r18dev': R18DevScraper,
     }
     
+    # Shared instances handed out by get_scraper, so their sessions keep
+    # connections alive from one file to the next
+    _instances: Dict[str, BaseScraper] = {}
+    _instances_lock = threading.Lock()
+    
     @classmethod
     def get_available_scrapers(cls) -> List[str]:
         """
@@ -37,15 +45,55 @@ class ScraperFactory:
             return scraper_class()
         return None
     
+    @classmethod
+    def get_scraper(cls, name: str) -> Optional[BaseScraper]:
+        """
+        Get the shared scraper instance for a name, creating it on first use.
+        
+        Args:
+            name: Name of the scraper
+            
+        Returns:
+            Scraper instance or None if not found
+        """
+        name = name.lower()
+        scraper = cls._instances.get(name)
+        if scraper is None:
+            with cls._instances_lock:
+                scraper = cls._instances.get(name)
+                if scraper is None:
+                    scraper = cls.create_scraper(name)
+                    if scraper:
+                        cls._instances[name] = scraper
+        return scraper
+    
+    @classmethod
+    def get_scrapers(cls, names: Optional[List[str]] = None) -> Dict[str, BaseScraper]:
+        """
+        Get the shared instances for several scrapers.
+        
+        Args:
+            names: Scraper names (default: all available); unknown names are skipped
+            
+        Returns:
+            Dictionary mapping scraper names to instances, in the given order
+        """
+        scrapers = {}
+        for name in names or cls.get_available_scrapers():
+            scraper = cls.get_scraper(name)
+            if scraper:
+                scrapers[name] = scraper
+        return scrapers
+    
     @classmethod
     def create_all_scrapers(cls) -> List[BaseScraper]:
         """
-        Create instances of all available scrapers.
+        Get instances of all available scrapers (the shared ones from get_scraper).
         
         Returns:
             List of all scraper instances
         """
-        return [cls.create_scraper(name) for name in cls.get_available_scrapers()]
+        return [cls.get_scraper(name) for name in cls.get_available_scrapers()]
     
     @classmethod
     def register_scraper(cls, name: str, scraper_class: Type[BaseScraper]) -> None:
@@ -57,11 +105,12 @@ class ScraperFactory:
             scraper_class: Scraper class to register
         """
         cls._scrapers[name.lower()] = scraper_class
+        cls._instances.pop(name.lower(), None)
     
     @classmethod
-    def search_all(cls, jav_code: str) -> Dict[str, Optional[Dict]]:
+    async def search_all_async(cls, jav_code: str) -> Dict[str, Optional[Dict]]:
         """
-        Search all scrapers for metadata.
+        Search all scrapers for metadata concurrently.
         
         Args:
             jav_code: JAV code to search for
@@ -69,15 +118,71 @@ class ScraperFactory:
         Returns:
             Dictionary mapping scraper names to metadata results
         """
+        scrapers = cls.get_scrapers()
+        
+        outcomes = await asyncio.gather(
+            *(scraper.search_async(jav_code) for scraper in scrapers.values()),
+            return_exceptions=True
+        )
+        
         results = {}
+        for name, outcome in zip(scrapers, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"Error searching with {name} scraper: {outcome}")
+                results[name] = None
+            else:
+                results[name] = outcome
         
-        for name in cls.get_available_scrapers():
-            scraper = cls.create_scraper(name)
-            if scraper:
+        return results
+    
+    @classmethod
+    def search_first(cls, jav_code: str, names: Optional[List[str]] = None) -> Optional[Tuple[str, Dict]]:
+        """
+        Search scrapers concurrently and return the first result found.
+        
+        Scrapers that have not started yet are cancelled once a result
+        arrives; ones already in flight finish in the background.
+        
+        Args:
+            jav_code: JAV code to search for
+            names: Scraper names to use (default: all available)
+            
+        Returns:
+            Tuple of (scraper name, metadata), or None if no scraper found data
+        """
+        scrapers = cls.get_scrapers(names)
+        if not scrapers:
+            return None
+        
+        executor = ThreadPoolExecutor(max_workers=len(scrapers))
+        futures = {executor.submit(scraper.search, jav_code): name for name, scraper in scrapers.items()}
+        try:
+            for future in as_completed(futures):
                 try:
-                    results[name] = scraper.search(jav_code)
+                    result = future.result()
                 except Exception as e:
-                    print(f"Error searching with {name} scraper: {e}")
-                    results[name] = None
+                    print(f"Error searching with {futures[future]} scraper: {e}")
+                    continue
+                if result:
+                    return futures[future], result
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    @classmethod
+    def search_all(cls, jav_code: str) -> Dict[str, Optional[Dict]]:
+        """
+        Search all scrapers for metadata.
+        
+        Scrapers run concurrently, so the call takes about as long as the
+        slowest scraper rather than the sum of all of them.
         
-        return results 
\ No newline at end of file
+        Args:
+            jav_code: JAV code to search for
+            
+        Returns:
+            Dictionary mapping scraper names to metadata results
+        """
+        return asyncio.run(cls.search_all_async(jav_code))
@@ -3,6 +3,59 @@ from typing import Dict, Optional, Any, List
 from .base import BaseScraper
 from config.settings import settings
 from utils.pattern import PatternMatcher
+from utils.scraper_cache import cached_scrape
+
+# Only request the fields format_metadata reads, so large galleries and
+# cast lists carry no unused data to download and parse
+_QUERY = """
+query ContentPageData($id: ID!) {
+ ppvContent(id: $id) {
+  id
+  title
+  description
+  packageImage {
+    largeUrl
+    mediumUrl
+  }
+  sampleImages {
+    largeImageUrl
+  }
+  deliveryStartDate
+  duration
+  actresses {
+    name
+    imageUrl
+  }
+  directors {
+    name
+  }
+  series {
+    name
+  }
+  maker {
+    name
+  }
+  label {
+    name
+  }
+  genres {
+    name
+  }
+  makerContentId
+  }
+  reviewSummary(contentId: $id) {
+    average
+    total
+  }
+}
+"""
+
+# The request body, serialized once: only the content ID is spliced in per search
+_PAYLOAD_PREFIX, _PAYLOAD_SUFFIX = json.dumps({
+    "operationName": "ContentPageData",
+    "query": " ".join(_QUERY.split()),
+    "variables": {"id": "__ID__"},
+}).encode().split(b'"__ID__"')
 
 class FanzaScraper(BaseScraper):
     """Fanza scraper implementation."""
@@ -14,6 +67,7 @@ class FanzaScraper(BaseScraper):
     def get_name(self) -> str:
         return "Fanza"
     
+    @cached_scrape(ttl_hours=72)
     def search(self, jav_code: str) -> Optional[Dict[str, Any]]:
         """
         Search for metadata using Fanza GraphQL API.
@@ -27,73 +81,10 @@ class FanzaScraper(BaseScraper):
         # Convert JAV code to content ID for Fanza API
         content_id = PatternMatcher.jav_code_to_content_id(jav_code)
         
-        payload = {
-            "operationName": "ContentPageData",
-            "query": """
-            query ContentPageData($id: ID!) {
-             ppvContent(id: $id) {
-              id
-              floor
-              title
-              releaseStatus
-              description
-              packageImage {
-                largeUrl
-                mediumUrl
-              }
-              sampleImages {
-                number
-                imageUrl
-                largeImageUrl
-              }
-              deliveryStartDate
-              makerReleasedAt
-              duration
-              actresses {
-                id
-                name
-                nameRuby
-                imageUrl
-              }
-              directors {
-                id
-                name
-              }
-              series {
-                id
-                name
-              }
-              maker {
-                id
-                name
-              }
-              label {
-                id
-                name
-              }
-              genres {
-                id
-                name
-              }
-              contentType
-              makerContentId
-              }
-              reviewSummary(contentId: $id) {
-                average
-                total
-                withCommentTotal
-              }
-            }
-            """,
-            "variables": {
-                "id": content_id
-            }
-        }
-        
         response = self._make_request(
             self.api_url,
             method='POST',
-            json=payload,
+            data=_PAYLOAD_PREFIX + json.dumps(content_id).encode() + _PAYLOAD_SUFFIX,
             headers={'Content-Type': 'application/json'}
         )
         
@@ -101,7 +92,7 @@ class FanzaScraper(BaseScraper):
             return None
         
         try:
-            data = response.json()
+            data = self._parse_json(response)
             return self.format_metadata(data)
         except json.JSONDecodeError:
             print(f"Failed to parse JSON response for {jav_code}")
@@ -118,19 +109,19 @@ class FanzaScraper(BaseScraper):
             Formatted metadata
         """
         try:
-            content = raw_data.get('data', {}).get('ppvContent', {})
+            data_root = raw_data.get('data') or {}
+            content = data_root.get('ppvContent')
             if not content:
                 return {}
 
             # Extract basic info
             title = content.get('title', '')
-            description = content.get('description', '')
+            description = content.get('description') or ''
+            outline = description if len(description) <= 100 else description[:100] + '...'
             duration = content.get('duration', 0)
             
             # Extract release date
-            release_date = content.get('deliveryStartDate', '')
-            if release_date:
-                release_date = release_date.split('T')[0]  # Get date part only
+            release_date = (content.get('deliveryStartDate') or '').partition('T')[0]  # Get date part only
             
             # Extract directors
             directors = [director["name"] for director in content.get('directors', [])]
@@ -172,18 +163,18 @@ class FanzaScraper(BaseScraper):
             jav_id = content.get('makerContentId', '')
             
             # Extract rating info
-            review = raw_data.get('data', {}).get('reviewSummary', {})
-            rating = review.get('average', '') if review else ''
-            votes = review.get('total', '') if review else ''
+            review = data_root.get('reviewSummary') or {}
+            rating = review.get('average', '')
+            votes = review.get('total', '')
 
             return {
                 'title': title,
                 'original_title': title,
                 'sort_title': title,
                 'plot': description,
-                'outline': description[:100] + '...' if len(description) > 100 else description,
+                'outline': outline,
                 'tagline': '',
-                'year': release_date.split('-')[0] if release_date else '',
+                'year': self._release_year(release_date),
                 'release_date': release_date,
                 'runtime': runtime,
                 'rating': rating,
@@ -1,8 +1,16 @@
 import json
+from operator import itemgetter
 from typing import Dict, Optional, Any, List
 from .base import BaseScraper
 from config.settings import settings
 from utils.pattern import PatternMatcher
+from utils.scraper_cache import cached_scrape
+
+_IMAGE_BASE_URL = "https://awsimgsrc.dmm.co.jp/pics_dig/mono/actjpgs/"
+
+# Response keys per language: (title, person name, label, category, series, maker)
+_EN_KEYS = ('title_en', 'name_romaji', 'label_name_en', 'name_en', 'series_name_en', 'maker_name_en')
+_JA_KEYS = ('title_ja', 'name_kanji', 'label_name_ja', 'name_ja', 'series_name_ja', 'maker_name_ja')
 
 class R18DevScraper(BaseScraper):
     """R18.dev JSON API scraper implementation."""
@@ -10,10 +18,18 @@ class R18DevScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://r18.dev/videos/vod/movies/detail/-/combined={}/json"
+        # Language preference is fixed for the run, so pick the keys once
+        self._language = settings.R18DEV_LANGUAGE.lower()
+        self._keys = _EN_KEYS if self._language == "en" else _JA_KEYS
     
     def get_name(self) -> str:
         return "R18.dev"
     
+    def cache_key(self) -> str:
+        # Results are formatted in the configured language
+        return f"{self.get_name()}:{self._language}"
+    
+    @cached_scrape(ttl_hours=72)
     def search(self, jav_code: str) -> Optional[Dict[str, Any]]:
         """
         Search for metadata using R18.dev JSON API.
@@ -37,7 +53,7 @@ class R18DevScraper(BaseScraper):
             return None
         
         try:
-            data = response.json()
+            data = self._parse_json(response)
             
             # Check if we got valid data
             if not data or not data.get('content_id'):
@@ -63,46 +79,33 @@ class R18DevScraper(BaseScraper):
         Returns:
             Formatted metadata dictionary
         """
-        # Determine language preference
-        use_english = settings.R18DEV_LANGUAGE.lower() == "en"
-        IMAGE_BASE_URL = "https://awsimgsrc.dmm.co.jp/pics_dig/mono/actjpgs/"
-
-        # Select title based on language preference
-        if use_english:
-            primary_title = raw_data.get('title_en') or ''
-            secondary_title = raw_data.get('title_ja') or ''
-            directors = [d.get('name_romaji', '') for d in raw_data.get('directors', []) if d.get('name_romaji')]
-            label = raw_data.get('label_name_en') or ''
-            categories = [category['name_en'] for category in raw_data.get('categories', [])]
-            series = raw_data.get('series_name_en') or ''
-            maker = raw_data.get('maker_name_en') or ''
-            actresses = [
-                {'name': a.get('name_romaji', '') or '', 'image': IMAGE_BASE_URL + a['image_url'] if a.get('image_url') else ''}
-                for a in raw_data.get('actresses', [])
-            ]
-        else:
-            primary_title = raw_data.get('title_ja') or ''
-            secondary_title = raw_data.get('title_en') or ''
-            directors = [d.get('name_kanji', '') for d in raw_data.get('directors', []) if d.get('name_kanji')]
-            label = raw_data.get('label_name_ja') or ''
-            categories = [category['name_ja'] for category in raw_data.get('categories', [])]
-            series = raw_data.get('series_name_ja') or ''
-            maker = raw_data.get('maker_name_ja') or ''
-            actresses = [
-                {'name': a.get('name_kanji', '') or '', 'image': IMAGE_BASE_URL + a['image_url'] if a.get('image_url') else ''}
-                for a in raw_data.get('actresses', [])
-            ]
-            
+        title_key, name_key, label_key, category_key, series_key, maker_key = self._keys
+        primary_title = raw_data.get(title_key) or ''
+        directors = list(filter(None, (d.get(name_key) for d in raw_data.get('directors', ()))))
+        label = raw_data.get(label_key) or ''
+        categories = list(map(itemgetter(category_key), raw_data.get('categories', ())))
+        series = raw_data.get(series_key) or ''
+        maker = raw_data.get(maker_key) or ''
+        
+        def format_actress(actress):
+            image = actress.get('image_url')
+            return {'name': actress.get(name_key) or '', 'image': _IMAGE_BASE_URL + image if image else ''}
+        
+        actresses = list(map(format_actress, raw_data.get('actresses', ())))
+        
+        release_date = raw_data.get('release_date') or ''
+        title_ja = raw_data.get('title_ja') or ''
+        
         metadata = {
             'source': 'r18.dev',
             'content_id': raw_data.get('content_id') or '',
             'id': raw_data.get('dvd_id') or '',
             'title': primary_title,
             'title_en': raw_data.get('title_en') or '',
-            'title_jp': raw_data.get('title_ja') or '',
-            'original_title': raw_data.get('title_ja') or '',
-            'release_date': raw_data.get('release_date') or '',
-            'year': (raw_data.get('release_date') or '').split('-')[0] if raw_data.get('release_date') else '',
+            'title_jp': title_ja,
+            'original_title': title_ja,
+            'release_date': release_date,
+            'year': self._release_year(release_date),
             'runtime': raw_data.get('runtime_mins', 0),
             'description': raw_data.get('comment_en') or '',
             'cover': raw_data.get('jacket_full_url') or '',
@@ -133,7 +136,7 @@ class R18DevScraper(BaseScraper):
             True if response is valid, False otherwise
         """
         try:
-            data = response.json()
+            data = self._parse_json(response)
             return bool(data and data.get('content_id'))
         except (json.JSONDecodeError, AttributeError):
             return False
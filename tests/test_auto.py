@@ -0,0 +1,88 @@
+"""Tests for --force in auto and batch mode."""
+
+import pytest
+from click.testing import CliRunner
+
+import main
+from config.settings import settings
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """Auto-mode app with a fake scraper, and no downloads, cache or prefetch."""
+    monkeypatch.setattr(settings, "IMAGE_DOWNLOAD_ENABLED", False)
+    monkeypatch.setattr(settings, "SUBTITLE_DOWNLOAD_ENABLED", False)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "OUTPUT_VIDEO_NAME_TEMPLATE", "<ID><EXT>")
+    app = main.JAVNFOGenerator()
+    app.searches = []
+
+    def search_with_priority(jav_code, log=print):
+        app.searches.append(jav_code)
+        return {'id': jav_code, 'title': f'Title {jav_code}', 'year': '2024', 'release_date': '2024-01-02'}
+
+    monkeypatch.setattr(app.multi_scraper, "search_with_priority", search_with_priority)
+    return app
+
+
+@pytest.fixture
+def library(tmp_path):
+    """One video, and an output folder that already holds its NFO."""
+    source = tmp_path / "in"
+    output = tmp_path / "out"
+    source.mkdir()
+    output.mkdir()
+    (source / "ABC-123.mp4").write_bytes(b"video")
+    (output / "ABC-123.nfo").write_text("old nfo")
+    return source, output
+
+
+def test_existing_nfo_is_skipped_without_force(app, library):
+    source, output = library
+    assert app.search_auto(str(source), str(output)) == 0
+    assert (output / "ABC-123.nfo").read_text() == "old nfo"
+    assert (source / "ABC-123.mp4").exists()
+    assert app.searches == []
+
+
+def test_force_regenerates_existing_nfo(app, library):
+    source, output = library
+    assert app.search_auto(str(source), str(output), force=True) == 1
+    assert "Title ABC-123" in (output / "ABC-123.nfo").read_text(encoding="utf-8")
+    assert (output / "ABC-123.mp4").read_bytes() == b"video"
+    assert app.searches == ["ABC-123"]
+
+
+def test_nfo_at_metadata_path_is_kept_without_force(app, library, monkeypatch):
+    # The pre-scrape check only sees the metadata-free path; the exclusive
+    # create must still refuse to replace an NFO named from the metadata
+    monkeypatch.setattr(settings, "OUTPUT_VIDEO_NAME_TEMPLATE", "<ID> <TITLE><EXT>")
+    source, output = library
+    (output / "ABC-123.nfo").unlink()
+    existing = output / "ABC-123 Title ABC-123.nfo"
+    existing.write_text("old nfo")
+    assert app.search_auto(str(source), str(output)) == 0
+    assert existing.read_text() == "old nfo"
+    assert (source / "ABC-123.mp4").exists()
+    assert app.search_auto(str(source), str(output), force=True) == 1
+    assert "Title ABC-123" in existing.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("command, flags, expected", [
+    ("auto", [], False),
+    ("auto", ["--force"], True),
+    ("batch", ["-F"], True),
+])
+def test_cli_passes_force_through(monkeypatch, tmp_path, command, flags, expected):
+    monkeypatch.setattr(settings, "SCRAPER_CACHE_REFRESH", False)
+    calls = []
+
+    class FakeApp:
+        def search_auto(self, directory, output_dir, translate, max_depth=0, force=False, jobs=None):
+            calls.append(force)
+            return 1
+
+    monkeypatch.setattr(main, "get_app", lambda: FakeApp())
+    result = CliRunner().invoke(main.cli, [command, "-d", str(tmp_path), *flags])
+    assert result.exit_code == 0
+    assert calls == [expected]
@@ -0,0 +1,40 @@
+"""Tests for NFO file writing and output paths."""
+
+import pytest
+
+from config.settings import settings
+from utils.file_utils import FileUtils
+
+
+def test_write_creates_file_and_parent_directory(tmp_path):
+    path = tmp_path / "sub" / "ABC-123.nfo"
+    assert FileUtils.write_nfo_bytes(b"<movie/>", str(path))
+    assert path.read_bytes() == b"<movie/>"
+
+
+def test_write_replaces_existing_file(tmp_path):
+    path = tmp_path / "ABC-123.nfo"
+    path.write_bytes(b"old content that is longer")
+    assert FileUtils.write_nfo_bytes(b"new", str(path))
+    assert path.read_bytes() == b"new"
+
+
+def test_exclusive_write_creates_new_file(tmp_path):
+    path = tmp_path / "ABC-123.nfo"
+    assert FileUtils.write_nfo_bytes(b"<movie/>", str(path), exclusive=True)
+    assert path.read_bytes() == b"<movie/>"
+
+
+def test_exclusive_write_raises_if_file_exists(tmp_path):
+    path = tmp_path / "ABC-123.nfo"
+    path.write_bytes(b"existing")
+    with pytest.raises(FileExistsError):
+        FileUtils.write_nfo_bytes(b"new", str(path), exclusive=True)
+    assert path.read_bytes() == b"existing"
+
+
+def test_default_output_paths_follow_output_dir_template(monkeypatch):
+    monkeypatch.setattr(settings, "OUTPUT_DIR_TEMPLATE", "first", raising=False)
+    assert FileUtils.get_output_paths("ABC-123.mp4", ".") == ("first/ABC-123.nfo", "ABC-123.mp4")
+    monkeypatch.setattr(settings, "OUTPUT_DIR_TEMPLATE", "second", raising=False)
+    assert FileUtils.get_output_paths("ABC-123.mp4", ".") == ("second/ABC-123.nfo", "ABC-123.mp4")
@@ -0,0 +1,83 @@
+"""Tests for the early-exit 'first' scraper strategy."""
+
+import threading
+import time
+
+import pytest
+
+from config.settings import settings
+from scrapers.factory import ScraperFactory
+from utils.multi_scraper import MultiScraperManager
+
+
+class FakeScraper:
+    """Scraper stand-in returning a canned result, optionally after a gate opens or a delay."""
+
+    def __init__(self, result=None, gate=None, error=None, delay=0):
+        self.result = result
+        self.gate = gate
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+
+    def search(self, jav_code):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def use_scrapers(monkeypatch):
+    """Make the factory hand out the given fake scrapers, in order."""
+    def use(**scrapers):
+        monkeypatch.setattr(ScraperFactory, "get_scrapers", classmethod(lambda cls, names=None: scrapers))
+        return scrapers
+    return use
+
+
+def test_first_result_does_not_wait_for_slower_scrapers(use_scrapers):
+    gate = threading.Event()
+    use_scrapers(r18dev=FakeScraper({'title': 'Slow'}, gate=gate), fanza=FakeScraper({'title': 'Fast'}))
+    start = time.monotonic()
+    try:
+        assert ScraperFactory.search_first("ABC-123") == ('fanza', {'title': 'Fast'})
+        assert time.monotonic() - start < 1
+    finally:
+        gate.set()
+
+
+def test_empty_and_failing_scrapers_are_skipped(use_scrapers, capsys):
+    use_scrapers(r18dev=FakeScraper(error=RuntimeError("boom")), fanza=FakeScraper(None),
+                 javlibrary=FakeScraper({'title': 'Found'}, delay=0.2))
+    assert ScraperFactory.search_first("ABC-123") == ('javlibrary', {'title': 'Found'})
+    assert "boom" in capsys.readouterr().out
+
+
+def test_no_data_from_any_scraper_returns_none(use_scrapers):
+    use_scrapers(r18dev=FakeScraper(None), fanza=FakeScraper({}))
+    assert ScraperFactory.search_first("ABC-123") is None
+
+
+def test_first_strategy_uses_only_the_first_result(use_scrapers, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_MERGE_STRATEGY", "first")
+    use_scrapers(fanza=FakeScraper({'title': 'Fanza title', 'studio': 'S1'}))
+    manager = MultiScraperManager()
+    monkeypatch.setattr(manager, "search_all_scrapers", lambda *args: pytest.fail("searched all scrapers"))
+    lines = []
+    result = manager.search_with_priority("ABC-123", lines.append)
+    assert result['title'] == 'Fanza title'
+    assert result['studio'] == 'S1'
+    assert result['_scrapers_used'] == ['fanza']
+    assert any("fanza found data first" in line for line in lines)
+
+
+def test_first_strategy_reports_no_data(use_scrapers, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_MERGE_STRATEGY", "first")
+    use_scrapers(r18dev=FakeScraper(None))
+    lines = []
+    assert MultiScraperManager().search_with_priority("ABC-123", lines.append) is None
+    assert "No data found from any scraper" in lines
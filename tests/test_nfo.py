@@ -0,0 +1,78 @@
+"""Tests for NFO rendering."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from generators.nfo import NFOGenerator
+
+
+@pytest.fixture
+def generator():
+    return NFOGenerator()
+
+
+def test_scraped_text_is_escaped(generator):
+    metadata = {
+        'id': 'ABC-123',
+        'title': 'Cats & Dogs <Uncut>',
+        'studio': 'A&B',
+        'genres': ['Drama & <Romance>'],
+        'directors': ['Dir <One>'],
+        'actresses': [{'name': 'Rin & Mai', 'image': 'http://img/1.jpg?a=1&b=2'}],
+    }
+    root = ET.fromstring(generator._format_content(metadata).encode("utf-8"))
+    assert root.findtext('title') == '[ABC-123] Cats & Dogs <Uncut>'
+    assert root.findtext('studio') == 'A&B'
+    assert root.findtext('genre') == 'Drama & <Romance>'
+    assert root.findtext('director') == 'Dir <One>'
+    assert root.findtext('actor/name') == 'Rin & Mai'
+    assert root.findtext('actor/thumb') == 'http://img/1.jpg?a=1&b=2'
+
+
+def test_plot_html_is_stripped_and_text_escaped(generator):
+    root = ET.fromstring(generator._format_content({'plot': 'One<br>Two & <b>three</b>'}).encode("utf-8"))
+    assert root.findtext('plot') == 'One\nTwo & three'
+
+
+def test_template_with_unknown_field_falls_back_to_basic_layout(monkeypatch, capsys):
+    monkeypatch.setattr(NFOGenerator, "template", "<movie><title>{title}</title>{no_such_field}</movie>")
+    content = NFOGenerator()._format_content({
+        'id': 'ABC-123',
+        'title': 'Cats & Dogs',
+        'genres': ['Drama'],
+        'actresses': [{'name': 'Rin', 'image': 'rin.jpg'}],
+    })
+    assert "no_such_field" in capsys.readouterr().out
+    root = ET.fromstring(content.encode("utf-8"))
+    assert root.tag == 'movie'
+    assert root.findtext('title') == 'Cats & Dogs'
+    assert root.findtext('mpaa') == 'XXX'
+    assert root.findtext('genre') == 'Drama'
+    assert root.findtext('actor/name') == 'Rin'
+    assert root.findtext('actor/thumb') == 'rin.jpg'
+
+
+@pytest.mark.parametrize("first, second", [
+    (1, True),
+    (4, 4.0),
+    (0, False),
+    ("1", 1),
+])
+def test_render_cache_keeps_equal_values_of_different_types_apart(generator, first, second):
+    first_root = ET.fromstring(generator._format_content({'id': 'ABC-123', 'rating': first}).encode("utf-8"))
+    second_root = ET.fromstring(generator._format_content({'id': 'ABC-123', 'rating': second}).encode("utf-8"))
+    assert first_root.findtext('rating') == str(first)
+    assert second_root.findtext('rating') == str(second)
+
+
+def test_render_cache_keys_nested_values_by_type(generator):
+    first = generator._format_content({'actresses': [{'name': 'Rin', 'image': 1}]})
+    second = generator._format_content({'actresses': [{'name': 'Rin', 'image': True}]})
+    assert ET.fromstring(first.encode("utf-8")).findtext('actor/thumb') == '1'
+    assert ET.fromstring(second.encode("utf-8")).findtext('actor/thumb') == 'True'
+
+
+def test_render_cache_reuses_identical_metadata(generator):
+    metadata = {'id': 'ABC-123', 'title': 'Title', 'genres': ['Drama']}
+    assert generator._format_encoded(metadata) is generator._format_encoded(dict(metadata))
@@ -0,0 +1,59 @@
+"""Tests for the video file walk in PatternMatcher."""
+
+import os
+
+import pytest
+
+from utils.pattern import PatternMatcher
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Video tree two levels deep, with files that must be skipped."""
+    for path in (
+        "ABC-123.mp4",
+        "DEF-456.MKV",
+        "notes.txt",
+        "holiday.mp4",
+        "ABC-999.nfo",
+        "one/GHI-789.avi",
+        "one/two/JKL-012.wmv",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(b"")
+    # A directory with a video extension is not a video file
+    (tmp_path / "MNO-345.mp4").mkdir()
+    return tmp_path
+
+
+def test_depth_zero_lists_only_top_level_videos(library):
+    assert sorted(PatternMatcher.find_video_files(str(library))) == [
+        ("ABC-123.mp4", "ABC-123"),
+        ("DEF-456.MKV", "DEF-456"),
+    ]
+
+
+def test_depth_limits_descent(library):
+    found = dict(PatternMatcher.find_video_files(str(library), max_depth=1))
+    assert os.path.join("one", "GHI-789.avi") in found
+    assert os.path.join("one", "two", "JKL-012.wmv") not in found
+
+
+def test_full_depth_returns_paths_relative_to_directory(library):
+    assert sorted(PatternMatcher.find_video_files(str(library), max_depth=5)) == [
+        ("ABC-123.mp4", "ABC-123"),
+        ("DEF-456.MKV", "DEF-456"),
+        (os.path.join("one", "GHI-789.avi"), "GHI-789"),
+        (os.path.join("one", "two", "JKL-012.wmv"), "JKL-012"),
+    ]
+
+
+def test_iter_video_files_is_lazy(library):
+    walk = PatternMatcher.iter_video_files(str(library), max_depth=5)
+    assert next(walk)[1] in {"ABC-123", "DEF-456", "GHI-789", "JKL-012"}
+    walk.close()
+
+
+def test_missing_directory_yields_nothing(tmp_path, capsys):
+    assert PatternMatcher.find_video_files(str(tmp_path / "missing")) == []
+    assert "not found" in capsys.readouterr().out
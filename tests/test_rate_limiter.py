@@ -0,0 +1,73 @@
+"""Tests for the per-host token bucket rate limiter."""
+
+import pytest
+
+from utils import rate_limiter as rate_limiter_module
+from utils.rate_limiter import HostRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; time.sleep advances it instead of blocking."""
+    state = {"now": 100.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", sleep)
+    return state
+
+
+def test_first_request_is_immediate(clock):
+    limiter = HostRateLimiter({"a.example": 2.0})
+    limiter.acquire("a.example")
+    assert clock["sleeps"] == []
+
+
+def test_requests_to_same_host_are_paced(clock):
+    limiter = HostRateLimiter({"a.example": 2.0})
+    for _ in range(3):
+        limiter.acquire("a.example")
+    assert clock["sleeps"] == pytest.approx([0.5, 0.5])
+
+
+def test_idle_time_refills_the_bucket(clock):
+    limiter = HostRateLimiter({"a.example": 2.0})
+    limiter.acquire("a.example")
+    clock["now"] += 1.0
+    limiter.acquire("a.example")
+    assert clock["sleeps"] == []
+
+
+def test_hosts_do_not_wait_on_each_other(clock):
+    limiter = HostRateLimiter({"a.example": 1.0, "b.example": 1.0})
+    limiter.acquire("a.example")
+    limiter.acquire("b.example")
+    assert clock["sleeps"] == []
+
+
+def test_burst_allows_back_to_back_requests(clock):
+    limiter = HostRateLimiter({"a.example": 1.0}, burst=3)
+    for _ in range(3):
+        limiter.acquire("a.example")
+    assert clock["sleeps"] == []
+    limiter.acquire("a.example")
+    assert clock["sleeps"] == pytest.approx([1.0])
+
+
+def test_unlisted_host_uses_default_rate(clock):
+    limiter = HostRateLimiter({}, default_rps=4.0)
+    limiter.acquire("c.example")
+    limiter.acquire("c.example")
+    assert clock["sleeps"] == pytest.approx([0.25])
+
+
+def test_unlimited_and_missing_hosts_never_wait(clock):
+    limiter = HostRateLimiter({"a.example": 0.0})
+    for _ in range(3):
+        limiter.acquire("a.example")
+        limiter.acquire("other.example")
+        limiter.acquire(None)
+    assert clock["sleeps"] == []
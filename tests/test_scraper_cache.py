@@ -0,0 +1,104 @@
+"""Tests for the persistent scraper result cache."""
+
+import pytest
+
+from config.settings import settings
+from utils import scraper_cache as scraper_cache_module
+from utils.scraper_cache import ScraperCache, cached_scrape
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Fresh cache database used by cached_scrape, with caching enabled."""
+    cache = ScraperCache(tmp_path / "scraper_cache.db")
+    monkeypatch.setattr(scraper_cache_module, "scraper_cache", cache)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "SCRAPER_CACHE_REFRESH", False)
+    return cache
+
+
+class FakeScraper:
+    """Scraper stand-in that counts searches and returns canned results."""
+
+    def __init__(self, results, key="Fake"):
+        self.results = results
+        self.key = key
+        self.calls = []
+
+    def cache_key(self):
+        return self.key
+
+    @cached_scrape(ttl_hours=1)
+    def search(self, jav_code):
+        self.calls.append(jav_code)
+        return self.results.get(jav_code)
+
+
+def test_get_returns_stored_result(cache):
+    cache.set("Fake", "ABC-123", {"id": "ABC-123", "genres": ["a", "b"]})
+    assert cache.get("Fake", "ABC-123", ttl_hours=1) == {"id": "ABC-123", "genres": ["a", "b"]}
+    assert cache.get("Other", "ABC-123", ttl_hours=1) is None
+
+
+def test_entries_expire_after_ttl(cache, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(scraper_cache_module.time, "time", lambda: now)
+    cache.set("Fake", "ABC-123", {"id": "ABC-123"})
+
+    now += 3599
+    assert cache.get("Fake", "ABC-123", ttl_hours=1) is not None
+    now += 2
+    assert cache.get("Fake", "ABC-123", ttl_hours=1) is None
+
+
+def test_repeat_search_is_served_from_cache(cache):
+    scraper = FakeScraper({"ABC-123": {"id": "ABC-123"}})
+    assert scraper.search("ABC-123") == {"id": "ABC-123"}
+    assert scraper.search("ABC-123") == {"id": "ABC-123"}
+    assert scraper.calls == ["ABC-123"]
+
+
+def test_empty_results_are_not_cached(cache):
+    scraper = FakeScraper({"ABC-123": {}})
+    assert not scraper.search("ABC-123")
+    assert not scraper.search("MISSING-1")
+    scraper.search("ABC-123")
+    assert scraper.calls == ["ABC-123", "MISSING-1", "ABC-123"]
+    assert cache.get_cache_stats() == {}
+
+
+def test_refresh_ignores_and_overwrites_cached_results(cache, monkeypatch):
+    cache.set("Fake", "ABC-123", {"id": "old"})
+    monkeypatch.setattr(settings, "SCRAPER_CACHE_REFRESH", True)
+    scraper = FakeScraper({"ABC-123": {"id": "new"}})
+
+    assert scraper.search("ABC-123") == {"id": "new"}
+    assert scraper.calls == ["ABC-123"]
+    assert cache.get("Fake", "ABC-123", ttl_hours=1) == {"id": "new"}
+
+
+def test_disabled_cache_always_searches(cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    scraper = FakeScraper({"ABC-123": {"id": "ABC-123"}})
+    scraper.search("ABC-123")
+    scraper.search("ABC-123")
+    assert scraper.calls == ["ABC-123", "ABC-123"]
+    assert cache.get_cache_stats() == {}
+
+
+def test_results_are_keyed_by_cache_key(cache):
+    english = FakeScraper({"ABC-123": {"title": "en"}}, key="R18.dev:en")
+    japanese = FakeScraper({"ABC-123": {"title": "ja"}}, key="R18.dev:ja")
+    assert english.search("ABC-123") == {"title": "en"}
+    assert japanese.search("ABC-123") == {"title": "ja"}
+    assert japanese.calls == ["ABC-123"]
+
+
+def test_r18dev_cache_key_includes_language(monkeypatch):
+    from scrapers.r18dev import R18DevScraper
+
+    monkeypatch.setattr(settings, "R18DEV_LANGUAGE", "en")
+    english = R18DevScraper().cache_key()
+    monkeypatch.setattr(settings, "R18DEV_LANGUAGE", "ja")
+    japanese = R18DevScraper().cache_key()
+    assert english != japanese
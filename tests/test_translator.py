@@ -0,0 +1,90 @@
+"""Tests for batched Google translation."""
+
+import pytest
+
+from utils import translator as translator_module
+from utils.cache import TranslationCache
+from utils.translator import Translator
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Records Google requests and answers with a canned reply."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.queries = []
+
+    def get(self, url, params=None, timeout=None):
+        self.queries.append(params['q'])
+        return FakeResponse(self.reply(params['q']))
+
+
+def google_reply(text):
+    """Google's response shape: translated sentence chunks in data[0]."""
+    lines = text.split("\n")
+    return [[[line.upper() + ("\n" if i < len(lines) - 1 else ""), line] for i, line in enumerate(lines)]]
+
+
+@pytest.fixture
+def translator(tmp_path, monkeypatch):
+    """Google translator with an isolated cache and no rate limiting."""
+    monkeypatch.setattr(translator_module, "translation_cache", TranslationCache(tmp_path / "cache.json"))
+    monkeypatch.setattr(translator_module.rate_limiter, "acquire", lambda host: None)
+    translator = Translator()
+    translator.service = "google"
+    return translator
+
+
+def test_google_batch_splits_reply_by_line(translator):
+    translator.session = FakeSession(google_reply)
+    assert translator._translate_google_batch(["one", "two", "three"]) == ["ONE", "TWO", "THREE"]
+    assert translator.session.queries == ["one\ntwo\nthree"]
+
+
+def test_google_batch_rejects_mismatched_line_count(translator):
+    translator.session = FakeSession(lambda text: [[["ONE TWO", text]]])
+    assert translator._translate_google_batch(["one", "two"]) is None
+
+
+def test_translate_many_sends_one_request_and_scatters(translator):
+    translator.session = FakeSession(google_reply)
+    items = [("one", "genres"), ("two", "genres"), ("one", "genres")]
+    assert translator.translate_many(items) == ["ONE", "TWO", "ONE"]
+    assert translator.session.queries == ["one\ntwo"]
+
+
+def test_translate_many_falls_back_when_line_count_differs(translator):
+    translator.session = FakeSession(lambda text: [[["MERGED", text]]])
+    singles = []
+
+    def translate_text(text, field_type="general"):
+        singles.append(text)
+        return text.upper()
+
+    translator.translate_text = translate_text
+    assert translator.translate_many([("one", "genres"), ("two", "genres")]) == ["ONE", "TWO"]
+    assert sorted(singles) == ["one", "two"]
+
+
+def test_translate_many_uses_cache_before_requesting(translator):
+    translator_module.translation_cache.set_cached_translation("one", "genres", "CACHED")
+    translator.session = FakeSession(google_reply)
+    singles = []
+    translator.translate_text = lambda text, field_type="general": singles.append(text) or text.upper()
+
+    assert translator.translate_many([("one", "genres"), ("two", "genres")]) == ["CACHED", "TWO"]
+    assert translator.session.queries == []
+    assert singles == ["two"]
@@ -5,10 +5,30 @@ Translation cache utilities for storing and retrieving translated values.
 import os
 import json
 import hashlib
+import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
 from config.settings import settings
 
+try:
+    import orjson  # Optional: much faster (de)serialization of large caches
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize cache data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse cache data from UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
 
 class TranslationCache:
     """Cache for translated values to ensure consistency."""
@@ -26,14 +46,16 @@ class TranslationCache:
         
         self.cache_file = Path(cache_file)
         self.cache = self._load_cache()
+        # Auto mode may translate several files at once; every update and the
+        # save that follows must not overlap another thread's
+        self._lock = threading.RLock()
     
     def _load_cache(self) -> Dict[str, Any]:
         """Load cache from file."""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                return _loads(self.cache_file.read_bytes())
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
                 print(f"Warning: Could not load cache file: {e}")
                 return self._get_default_cache()
         return self._get_default_cache()
@@ -53,8 +75,8 @@ class TranslationCache:
     def _save_cache(self):
         """Save cache to file."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                self.cache_file.write_bytes(_dumps(self.cache))
         except IOError as e:
             print(f"Warning: Could not save cache file: {e}")
     
@@ -103,8 +125,9 @@ class TranslationCache:
             return
         
         cache_key = self._get_cache_key(text, field_type)
-        self.cache[field_type][cache_key] = translation
-        self._save_cache()
+        with self._lock:
+            self.cache[field_type][cache_key] = translation
+            self._save_cache()
     
     def get_cached_metadata(self, jav_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -126,8 +149,9 @@ class TranslationCache:
             jav_id: JAV ID
             metadata: Metadata dictionary
         """
-        self.cache['metadata'][jav_id] = metadata
-        self._save_cache()
+        with self._lock:
+            self.cache['metadata'][jav_id] = metadata
+            self._save_cache()
     
     def clear_cache(self, field_type: str = None):
         """
@@ -136,13 +160,14 @@ class TranslationCache:
         Args:
             field_type: Specific field type to clear (None for all)
         """
-        if field_type:
-            if field_type in self.cache:
-                self.cache[field_type].clear()
-        else:
-            self.cache = self._get_default_cache()
-        
-        self._save_cache()
+        with self._lock:
+            if field_type:
+                if field_type in self.cache:
+                    self.cache[field_type].clear()
+            else:
+                self.cache = self._get_default_cache()
+            
+            self._save_cache()
     
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -151,10 +176,11 @@ class TranslationCache:
         Returns:
             Dictionary with cache entry counts
         """
-        return {
-            field_type: len(entries) 
-            for field_type, entries in self.cache.items()
-        }
+        with self._lock:
+            return {
+                field_type: len(entries) 
+                for field_type, entries in self.cache.items()
+            }
     
     def export_cache(self, output_file: str):
         """
@@ -164,8 +190,9 @@ class TranslationCache:
             output_file: Output file path
         """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                data = _dumps(self.cache)
+            Path(output_file).write_bytes(data)
         except IOError as e:
             print(f"Error exporting cache: {e}")
     
@@ -177,16 +204,16 @@ class TranslationCache:
             input_file: Input file path
         """
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                imported_cache = json.load(f)
+            imported_cache = _loads(Path(input_file).read_bytes())
             
             # Merge with existing cache
-            for field_type, entries in imported_cache.items():
-                if field_type in self.cache:
-                    self.cache[field_type].update(entries)
-            
-            self._save_cache()
-        except (json.JSONDecodeError, IOError) as e:
+            with self._lock:
+                for field_type, entries in imported_cache.items():
+                    if field_type in self.cache:
+                        self.cache[field_type].update(entries)
+                
+                self._save_cache()
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             print(f"Error importing cache: {e}")
 
 
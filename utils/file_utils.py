@@ -1,10 +1,19 @@
 import os
 import shutil
-from typing import Optional
+from typing import Optional, Set, Tuple
 from pathlib import Path
 import re
+from functools import lru_cache
 from config.settings import settings
 
+# Precompiled patterns for output path templating
+_TEMPLATE_TAG = re.compile(r"<([A-Z_]+)>")
+_INVALID_DIR_CHARS = re.compile(r'[<>:"\\|?*\x00-\x1F]')
+_INVALID_FILE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
+# Max filename/output_dir pairs remembered by get_output_path without metadata
+_PATH_CACHE_SIZE = 4096
+
 class FileUtils:
     """Utility class for file operations."""
     
@@ -30,6 +39,40 @@ class FileUtils:
         """
         Generate output path for NFO file, supporting tag replacement.
         """
+        return FileUtils.get_output_paths(filename, output_dir, metadata)[0]
+    
+    @staticmethod
+    def get_output_paths(filename: str, output_dir: str = ".", metadata: dict = None) -> Tuple[str, str]:
+        """
+        Generate the NFO path and output video name together.
+        
+        The NFO is named after the output video, so building both at once
+        runs the tag replacement a single time.
+        
+        Args:
+            filename: Original video filename
+            output_dir: Output directory or directory template
+            metadata: Metadata for tag replacement
+            
+        Returns:
+            Tuple of (NFO path, output video file name)
+        """
+        if not metadata:
+            # Without metadata the paths only depend on the filename and the output
+            # directory template, so reuse them. The template is resolved here so a
+            # changed OUTPUT_DIR_TEMPLATE is part of the cache key
+            if not output_dir or output_dir == ".":
+                output_dir = getattr(settings, "OUTPUT_DIR_TEMPLATE", "<ID>")
+            return FileUtils._default_output_paths(filename, output_dir)
+        return FileUtils._build_output_paths(filename, output_dir, metadata)
+    
+    @staticmethod
+    @lru_cache(maxsize=_PATH_CACHE_SIZE)
+    def _default_output_paths(filename: str, output_dir: str) -> Tuple[str, str]:
+        return FileUtils._build_output_paths(filename, output_dir, None)
+    
+    @staticmethod
+    def _build_output_paths(filename: str, output_dir: str, metadata: Optional[dict]) -> Tuple[str, str]:
         # Use output_dir or settings.OUTPUT_DIR_TEMPLATE
         if not output_dir or output_dir == ".":
             output_dir = getattr(settings, "OUTPUT_DIR_TEMPLATE", "<ID>")
@@ -41,16 +84,16 @@ class FileUtils:
                 if tag.lower() == "title" and isinstance(value, str) and len(value) > 50:
                     value = value[:50].rstrip() + "..."
                 return str(value) if value else tag
-            output_dir = re.sub(r"<([A-Z_]+)>", tag_replacer, output_dir)
+            output_dir = _TEMPLATE_TAG.sub(tag_replacer, output_dir)
         # Sanitize output_dir to be a valid folder name
-        output_dir = re.sub(r'[<>:"\\|?*\x00-\x1F]', '_', output_dir).strip() or "."
+        output_dir = _INVALID_DIR_CHARS.sub('_', output_dir).strip() or "."
 
         # Use the output video name (without extension) as the NFO base name
-        video_base = FileUtils.get_output_video_name(filename, output_dir, metadata)
-        nfo_base = os.path.splitext(video_base)[0]
+        video_name = FileUtils.get_output_video_name(filename, output_dir, metadata)
+        nfo_base = os.path.splitext(video_name)[0]
         nfo_filename = f"{nfo_base}.nfo"
 
-        return os.path.join(output_dir, nfo_filename)
+        return os.path.join(output_dir, nfo_filename), video_name
     
     @staticmethod
     def write_nfo_file(content: str, filepath: str) -> bool:
@@ -64,16 +107,52 @@ class FileUtils:
         Returns:
             True if successful, False otherwise
         """
+        # Encode once and take the raw os.write path
+        return FileUtils.write_nfo_bytes(content.encode('utf-8'), filepath)
+    
+    @staticmethod
+    def write_nfo_bytes(data: bytes, filepath: str, make_dirs: bool = True, exclusive: bool = False) -> bool:
+        """
+        Write pre-encoded NFO content to file.
+        
+        Goes straight to os.write, skipping Python's buffered text layer.
+        No fsync: NFO files can always be regenerated.
+        
+        Args:
+            data: UTF-8 encoded NFO content
+            filepath: Path to write the file to
+            make_dirs: Create the parent directory if missing (callers that
+                already created it can skip the extra syscall)
+            exclusive: Only create a new file; the existence check and the
+                open are one atomic syscall
+            
+        Returns:
+            True if successful, False otherwise
+            
+        Raises:
+            FileExistsError: If exclusive is set and the file already exists
+        """
         try:
             # Ensure directory exists
             directory = os.path.dirname(filepath)
-            if directory and not FileUtils.ensure_directory(directory):
+            if make_dirs and directory and not FileUtils.ensure_directory(directory):
                 return False
             
-            # Write file with UTF-8 encoding
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            flags = (os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+                     | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+            fd = os.open(filepath, flags, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
             return True
+        except FileExistsError:
+            if exclusive:
+                raise
+            return False
         except (IOError, OSError, PermissionError):
             return False
     
@@ -90,6 +169,25 @@ class FileUtils:
         """
         return os.path.isfile(filepath)
     
+    @staticmethod
+    def list_file_names(directory: str, suffix: str = "") -> Set[str]:
+        """
+        List the names of the files in a directory with a single scan.
+        
+        Args:
+            directory: Directory to list
+            suffix: Only include names ending with this (e.g. ".nfo")
+            
+        Returns:
+            Set of file names, empty if the directory cannot be read
+        """
+        try:
+            with os.scandir(directory or ".") as entries:
+                # Check the name first; is_file() may need a stat on filesystems without d_type
+                return {entry.name for entry in entries if entry.name.endswith(suffix) and entry.is_file()}
+        except OSError:
+            return set()
+    
     @staticmethod
     def get_file_size(filepath: str) -> Optional[int]:
         """
@@ -162,9 +260,9 @@ class FileUtils:
                 if tag.lower() == "ext":
                     value = ext
                 return str(value) if value else tag
-            video_name = re.sub(r"<([A-Z_]+)>", tag_replacer, video_name_template)
+            video_name = _TEMPLATE_TAG.sub(tag_replacer, video_name_template)
         else:
             video_name = os.path.basename(filename)
         # Sanitize filename
-        video_name = re.sub(r'[<>:"/\\|?*\x00-\x1F]', '_', video_name).strip() or "video" + ext
+        video_name = _INVALID_FILE_CHARS.sub('_', video_name).strip() or "video" + ext
         return video_name
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Shared HTTP session for scrapers, translation, subtitles and images.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.settings import settings
+
+
+def create_session() -> requests.Session:
+    """
+    Create a session with a large connection pool and retries on connection errors.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': settings.USER_AGENT})
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Global session: one connection pool and keep-alive per host for the whole run
+http_session = create_session()
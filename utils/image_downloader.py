@@ -1,6 +1,35 @@
 import os
-import requests
+import shutil
+import threading
+from email.utils import formatdate
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
+from utils.http_session import http_session
+
+# Image writes are buffered and copied in 512 KiB blocks: a typical cover
+# lands in one or two write calls without holding large buffers per thread
+_WRITE_BUFFER = 512 * 1024
+_CHUNK_SIZE = _WRITE_BUFFER
+
+def _is_complete_image(path):
+    """
+    Check that a saved image decodes fully.
+
+    Image.verify() does not decode JPEG data, so a truncated file would
+    pass it; load() raises on truncation.
+
+    Args:
+        path (str): Path to the image.
+
+    Returns:
+        bool: True if the image opens and decodes, False otherwise.
+    """
+    try:
+        with Image.open(path) as img:
+            img.load()
+        return True
+    except Exception:
+        return False
 
 def download_image(url, name, nfo_dir, min_height=300, poster=False):
     """
@@ -21,12 +50,26 @@ def download_image(url, name, nfo_dir, min_height=300, poster=False):
         return False
     ext = os.path.splitext(url)[1] or ".jpg"
     path = os.path.join(nfo_dir, f"{name}{ext}")
+    # Only fetch the body again if the image changed since we saved it. A file
+    # that doesn't decode (e.g. cut short by an older non-atomic download) is
+    # fetched unconditionally, so a 304 can't keep it forever
+    headers = {}
+    if os.path.exists(path) and _is_complete_image(path):
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(path), usegmt=True)
+    # Written next to the target and renamed over it once the body is complete,
+    # so a dropped connection never leaves a truncated image or clobbers a good one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
     try:
-        r = requests.get(url, timeout=10)
-        if r.status_code != 200:
-            return False
-        with open(path, "wb") as f:
-            f.write(r.content)
+        # Stream to disk in chunks instead of holding the whole image in memory
+        with http_session.get(url, headers=headers, stream=True, timeout=10) as r:
+            if r.status_code not in (200, 304):
+                return False
+            # On 304 the validated copy on disk is kept and still goes through the poster check
+            if r.status_code == 200:
+                r.raw.decode_content = True
+                with open(tmp_path, "wb", buffering=_WRITE_BUFFER) as f:
+                    shutil.copyfileobj(r.raw, f, _CHUNK_SIZE)
+                os.replace(tmp_path, path)
         # If this a poster, verify dimensions
         if poster and name == "folder":
             with Image.open(path) as img:
@@ -37,8 +80,31 @@ def download_image(url, name, nfo_dir, min_height=300, poster=False):
         return True
     except Exception as e:
         print(f"Error downloading {name}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
+def download_images(jobs):
+    """
+    Download several images concurrently.
+
+    The pool lives only for this call, with one thread per job, so nothing
+    outlives it and callers that already run on a pool don't share a
+    second long-lived one.
+
+    Args:
+        jobs (list): Tuples of download_image arguments (url, name, nfo_dir[, min_height, poster]).
+
+    Returns:
+        list: download_image result for each job, in order.
+    """
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        return list(pool.map(lambda job: download_image(*job), jobs))
+
 def crop_image(cover_path, poster_path, min_height=300):
     """
     Crop the cover image to create a poster image.
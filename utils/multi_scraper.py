@@ -1,7 +1,17 @@
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import os
+import sys
 from scrapers.factory import ScraperFactory
 from config.settings import settings
 
+# Dimmed status colors, matching main.py's terminal check
+_USE_COLOR = sys.stdout.isatty() and os.name != "nt"
+_DIM = "\x1b[2;37m" if _USE_COLOR else ""
+_DIM_GREEN = "\x1b[2;32m" if _USE_COLOR else ""
+_DIM_RED = "\x1b[2;31m" if _USE_COLOR else ""
+_RESET = "\x1b[0m" if _USE_COLOR else ""
+
 class MultiScraperManager:
     """
     Manages multiple scrapers with configurable field priorities.
@@ -34,38 +44,65 @@ class MultiScraperManager:
             'gallery': settings.FIELD_PRIORITY_GALLERY
         }
     
-    def search_all_scrapers(self, jav_code: str) -> Dict[str, Optional[Dict[str, Any]]]:
+    def search_all_scrapers(self, jav_code: str,
+                            log: Callable[[str], None] = print) -> Dict[str, Optional[Dict[str, Any]]]:
         """
         Search using all enabled scrapers.
         
         Args:
             jav_code: The JAV code to search for
+            log: Function used to print status lines
             
         Returns:
             Dictionary mapping scraper names to their results
         """
         results = {}
+        scrapers = {}
         
         for scraper_name in self.enabled_scrapers:
-            scraper = self.scraper_factory.create_scraper(scraper_name)
+            scraper = self.scraper_factory.get_scraper(scraper_name)
             if scraper:
-                print(f"\033[2;37mSearching with {scraper.get_name()}...\033[0m")
-                try:
-                    result = scraper.search(jav_code)
-                    results[scraper_name] = result
-                    if result:
-                        print(f"\033[2;32m✓ {scraper.get_name()} found data\033[0m")
-                    else:
-                        print(f"\033[2;31m✗ {scraper.get_name()} found no data\033[0m")
-                except Exception as e:
-                    print(f"\033[2;31m✗ {scraper.get_name()} failed: {e}\033[0m")
-                    results[scraper_name] = None
+                log(f"{_DIM}Searching with {scraper.get_name()}...{_RESET}")
+                scrapers[scraper_name] = scraper
+            else:
+                log(f"{_DIM_RED}✗ Failed to create scraper: {scraper_name}{_RESET}")
+            results[scraper_name] = None
+        
+        # Scrapers hit different sites, so run them concurrently
+        async def search_concurrently():
+            return await asyncio.gather(
+                *(scraper.search_async(jav_code) for scraper in scrapers.values()),
+                return_exceptions=True
+            )
+        
+        outcomes = asyncio.run(search_concurrently()) if scrapers else []
+        
+        for (scraper_name, scraper), result in zip(scrapers.items(), outcomes):
+            if isinstance(result, Exception):
+                log(f"{_DIM_RED}✗ {scraper.get_name()} failed: {result}{_RESET}")
+                continue
+            results[scraper_name] = result
+            if result:
+                log(f"{_DIM_GREEN}✓ {scraper.get_name()} found data{_RESET}")
             else:
-                print(f"\033[2;31m✗ Failed to create scraper: {scraper_name}\033[0m")
-                results[scraper_name] = None
+                log(f"{_DIM_RED}✗ {scraper.get_name()} found no data{_RESET}")
         
         return results
     
+    def prefetch(self, jav_code: str) -> None:
+        """
+        Run every enabled scraper for a code without printing, so the
+        results land in the scraper cache for a later search_with_priority.
+        
+        Args:
+            jav_code: The JAV code to search for
+        """
+        for scraper in self.scraper_factory.get_scrapers(self.enabled_scrapers).values():
+            try:
+                scraper.search(jav_code)
+            except Exception:
+                pass  # The real search reports failures
+    
     def merge_metadata(self, scraper_results: Dict[str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
         """
         Merge metadata from multiple scrapers based on field priorities.
@@ -229,29 +266,40 @@ class MultiScraperManager:
             return False
         return True
     
-    def search_with_priority(self, jav_code: str) -> Optional[Dict[str, Any]]:
+    def search_with_priority(self, jav_code: str, log: Callable[[str], None] = print) -> Optional[Dict[str, Any]]:
         """
         Search using multiple scrapers and merge results based on priorities.
         
         Args:
             jav_code: The JAV code to search for
+            log: Function used to print status lines
             
         Returns:
             Merged metadata dictionary or None if no data found
         """
-        print(f"Searching with {len(self.enabled_scrapers)} enabled scrapers: {', '.join(self.enabled_scrapers)}")
+        log(f"Searching with {len(self.enabled_scrapers)} enabled scrapers: {', '.join(self.enabled_scrapers)}")
+        
+        if settings.SCRAPER_MERGE_STRATEGY == "first":
+            # No merging needed, so don't wait for the slower scrapers
+            first = self.scraper_factory.search_first(jav_code, self.enabled_scrapers)
+            if not first:
+                log("No data found from any scraper")
+                return None
+            scraper_name, result = first
+            log(f"{_DIM_GREEN}✓ {scraper_name} found data first{_RESET}")
+            return self.merge_metadata({scraper_name: result})
         
         # Search all scrapers
-        scraper_results = self.search_all_scrapers(jav_code)
+        scraper_results = self.search_all_scrapers(jav_code, log)
         
         # Check if any scraper found data
         found_data = any(result is not None for result in scraper_results.values())
         if not found_data:
-            print("No data found from any scraper")
+            log("No data found from any scraper")
             return None
         
         # Merge results based on priorities
         merged_metadata = self.merge_metadata(scraper_results)
         
-        print(f"\033[2;32m✓ Merged metadata from {len(merged_metadata.get('_scrapers_used', []))} scrapers\033[0m")
+        log(f"{_DIM_GREEN}✓ Merged metadata from {len(merged_metadata.get('_scrapers_used', []))} scrapers{_RESET}")
         return merged_metadata
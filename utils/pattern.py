@@ -1,8 +1,34 @@
 import re
 import os
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
 from config.settings import settings
 
+# Precompiled patterns used per file and per scrape
+_NON_CODE_CHARS = re.compile(r'[^A-Za-z0-9-]')
+_CONTENT_ID_PARTS = re.compile(r'([a-zA-Z]+)(\d+)')
+_CONTENT_ID_FORMAT = re.compile(r'^[a-zA-Z]+\d+$')
+
+# Per-code results are memoized; the set of codes seen in one run is small
+_CODE_CACHE_SIZE = 4096
+
+# Fanza content ID rules used by jav_code_to_content_id, keyed by lowercase prefix
+_NO_ZERO_PAD_PREFIXES = frozenset({'smus', 'smjh', 'smub', 'smjs', 'smjx', 'orecz', 'nost', 'mfc', 'mfcs'})
+_PREFIX_1_PREFIXES = frozenset({
+    'sdmf', 'dldss', 'sw', 'start', 'stars', 'piyo', 'sdam', 'sdmm', 'hawa', 'fsdss', 'senn', 'fns'
+})
+_H_PREFIXES = {
+    'milk': 'h_1240',
+    'ambi': 'h_237',
+    'fnew': 'h_491',
+    'einav': 'h_1350',
+    'pjab': 'h_1604'
+}
+_NUMERIC_PREFIXES = {
+    'dhld': '36',
+    'fays': '55'
+}
+
 class PatternMatcher:
     """Utility class for pattern matching and JAV code extraction."""
     
@@ -21,13 +47,14 @@ class PatternMatcher:
         name_without_ext = os.path.splitext(filename)[0]
         
         # Find JAV code pattern
-        match = re.search(settings.JAV_CODE_PATTERN, name_without_ext, re.IGNORECASE)
+        match = settings.JAV_CODE_REGEX.search(name_without_ext)
         
         if match:
             return match.group().upper()
         return None
     
     @staticmethod
+    @lru_cache(maxsize=_CODE_CACHE_SIZE)
     def jav_code_to_content_id(jav_code: str) -> str:
         """
         Convert JAV code to Fanza content ID.
@@ -39,7 +66,7 @@ class PatternMatcher:
             Fanza content ID (e.g., "sone00638", "1sdmf00022", "h_1240milk00225", "36dhld00011")
         """
         # Remove any non-alphanumeric characters except dash
-        clean_code = re.sub(r'[^A-Za-z0-9-]', '', jav_code)
+        clean_code = _NON_CODE_CHARS.sub('', jav_code)
         
         # Split by dash
         parts = clean_code.split('-')
@@ -52,41 +79,28 @@ class PatternMatcher:
         if prefix_lower == 't28':
             return f"55t28{number.zfill(5)}"
         
-        if prefix_lower in ['abf', 'abw']:
+        if prefix_lower in ('abf', 'abw'):
             return f"118{prefix_lower}{number.zfill(3)}"
         
-        no_zero_pad_codes = {'smus', 'smjh', 'smub', 'smjs', 'smjx', 'orecz', 'nost', 'mfc', 'mfcs'}
-        if prefix_lower in no_zero_pad_codes:
+        if prefix_lower in _NO_ZERO_PAD_PREFIXES:
             return f"{prefix_lower}{number.zfill(3)}"
 
         # Pad number with zeros to 5 digits
         padded_number = number.zfill(5)
         
         # Pattern 1: Prefix with "1" instead of "00" for specific codes
-        prefix_1_codes = {
-            'sdmf', 'dldss', 'sw', 'start', 'stars', 'piyo', 'sdam', 'sdmm', 'hawa', 'fsdss', 'senn', 'fns'
-        }
-        if prefix_lower in prefix_1_codes:
+        if prefix_lower in _PREFIX_1_PREFIXES:
             return f"1{prefix_lower}{padded_number}"
         
         # Pattern 2: Prefix with "h_" and specific numbers for certain maker codes
-        h_prefix_codes = {
-            'milk': 'h_1240',
-            'ambi': 'h_237', 
-            'fnew': 'h_491',
-            'einav': 'h_1350',
-            'pjab': 'h_1604'
-        }
-        if prefix_lower in h_prefix_codes:
-            return f"{h_prefix_codes[prefix_lower]}{prefix_lower}{padded_number}"
+        h_prefix = _H_PREFIXES.get(prefix_lower)
+        if h_prefix:
+            return f"{h_prefix}{prefix_lower}{padded_number}"
         
         # Pattern 3: Numeric prefix before the code for specific patterns
-        numeric_prefix_codes = {
-            'dhld': '36',
-            'fays': '55'
-        }
-        if prefix_lower in numeric_prefix_codes:
-            return f"{numeric_prefix_codes[prefix_lower]}{prefix_lower}{padded_number}"
+        numeric_prefix = _NUMERIC_PREFIXES.get(prefix_lower)
+        if numeric_prefix:
+            return f"{numeric_prefix}{prefix_lower}{padded_number}"
         
         # Default pattern: standard format
         return f"{prefix_lower}{padded_number}"
@@ -103,7 +117,7 @@ class PatternMatcher:
             JAV code (e.g., "SONE-638")
         """
         # Extract prefix (letters) and number
-        match = re.match(r'([a-zA-Z]+)(\d+)', content_id)
+        match = _CONTENT_ID_PARTS.match(content_id)
         if not match:
             return content_id.upper()  # Return as-is if no pattern found
         
@@ -132,47 +146,77 @@ class PatternMatcher:
         return ext in settings.VIDEO_EXTENSIONS
     
     @staticmethod
-    def find_video_files(directory: str = ".", max_depth: int = 0) -> List[Tuple[str, str]]:
+    def iter_video_files(directory: str = ".", max_depth: int = 0) -> Iterator[Tuple[str, str]]:
         """
-        Find all video files in directory with their JAV codes.
+        Lazily walk a directory for video files with their JAV codes.
+        
+        Uses a stack of os.scandir iterators so file type checks come from the
+        cached directory entries, and yields each match as soon as it is found.
         
         Args:
             directory: Directory to search in
             max_depth: Maximum depth to search (0 = current directory only)
             
-        Returns:
-            List of tuples (filename, jav_code)
+        Yields:
+            Tuples (filename, jav_code), filename relative to directory
         """
-        video_files = []
+        extensions = settings.VIDEO_EXTENSIONS
         
-        def scan_directory(current_dir: str, current_depth: int):
-            """Recursively scan directory for video files."""
+        def open_directory(path: str):
             try:
-                for item in os.listdir(current_dir):
-                    item_path = os.path.join(current_dir, item)
-                    
-                    # Check if it's a video file
-                    if os.path.isfile(item_path) and PatternMatcher.is_video_file(item):
-                        jav_code = PatternMatcher.extract_jav_code(item)
-                        if jav_code:
-                            # Store relative path from original directory
-                            rel_path = os.path.relpath(item_path, directory)
-                            video_files.append((rel_path, jav_code))
-                    
-                    # Recursively scan subdirectories if depth allows
-                    elif os.path.isdir(item_path) and current_depth < max_depth:
-                        scan_directory(item_path, current_depth + 1)
-                        
+                return os.scandir(path)
             except FileNotFoundError:
-                print(f"Directory {current_dir} not found.")
+                print(f"Directory {path} not found.")
             except PermissionError:
-                print(f"Permission denied accessing directory {current_dir}.")
+                print(f"Permission denied accessing directory {path}.")
+            return None
+        
+        root = open_directory(directory)
+        if root is None:
+            return
         
-        # Start scanning from the specified directory
-        scan_directory(directory, 0)
-        return video_files
+        stack = [(root, 0)]
+        try:
+            while stack:
+                entries, depth = stack[-1]
+                entry = next(entries, None)
+                if entry is None:
+                    stack.pop()[0].close()
+                    continue
+                
+                # Check if it's a video file: a set lookup on the extension,
+                # and only then is_file() (a stat where d_type is unavailable)
+                if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                    jav_code = PatternMatcher.extract_jav_code(entry.name)
+                    if jav_code:
+                        # Store relative path from original directory
+                        yield os.path.relpath(entry.path, directory), jav_code
+                
+                # Descend into subdirectories if depth allows
+                elif depth < max_depth and entry.is_dir():
+                    sub_entries = open_directory(entry.path)
+                    if sub_entries is not None:
+                        stack.append((sub_entries, depth + 1))
+        finally:
+            for entries, _ in stack:
+                entries.close()
     
     @staticmethod
+    def find_video_files(directory: str = ".", max_depth: int = 0) -> List[Tuple[str, str]]:
+        """
+        Find all video files in directory with their JAV codes.
+        
+        Args:
+            directory: Directory to search in
+            max_depth: Maximum depth to search (0 = current directory only)
+            
+        Returns:
+            List of tuples (filename, jav_code)
+        """
+        return list(PatternMatcher.iter_video_files(directory, max_depth))
+    
+    @staticmethod
+    @lru_cache(maxsize=_CODE_CACHE_SIZE)
     def normalize_jav_code(code: str) -> str:
         """
         Normalize JAV code format.
@@ -184,7 +228,7 @@ class PatternMatcher:
             Normalized JAV code
         """
         # Remove any non-alphanumeric characters except dash
-        normalized = re.sub(r'[^A-Za-z0-9-]', '', code)
+        normalized = _NON_CODE_CHARS.sub('', code)
         
         # Convert to uppercase
         normalized = normalized.upper()
@@ -192,6 +236,7 @@ class PatternMatcher:
         return normalized
     
     @staticmethod
+    @lru_cache(maxsize=_CODE_CACHE_SIZE)
     def validate_jav_code(code: str) -> bool:
         """
         Validate JAV code format.
@@ -206,26 +251,30 @@ class PatternMatcher:
             return False
         
         # Check if it's a content ID format (e.g., sone00638)
-        if re.match(r'^[a-zA-Z]+\d+$', code):
+        if _CONTENT_ID_FORMAT.match(code):
             return True
             
         # Check if it matches the JAV code pattern
-        return bool(re.match(settings.JAV_CODE_PATTERN, code, re.IGNORECASE))
+        return bool(settings.JAV_CODE_REGEX.match(code))
     
     @staticmethod
-    def filter_genres(genres: str) -> str:
+    def filter_genres(genres: Union[str, List[str]]) -> Union[str, List[str]]:
         """
         Filter out genres that should be skipped.
         
         Args:
-            genres: Comma-separated genres string
+            genres: Genre list, or a comma-separated genres string
             
         Returns:
-            Filtered genres string
+            Filtered genres, in the same form as the input
         """
         if not genres:
             return genres
         
+        # Scrapers return genre arrays; filter those without a join/split round trip
+        if isinstance(genres, list):
+            return [genre for genre in genres if genre and genre not in settings.SKIP_GENRES]
+        
         # Split genres and filter out skipped ones
         genre_list = [genre.strip() for genre in genres.split(',')]
         filtered_genres = []
@@ -0,0 +1,59 @@
+"""
+Per-host rate limiting for outgoing HTTP requests.
+"""
+
+import time
+import threading
+from typing import Dict, Optional, Tuple
+from config.settings import settings
+
+
+class HostRateLimiter:
+    """Token bucket per host, shared by every scraper and thread."""
+
+    def __init__(self, rps_per_host: Dict[str, float], default_rps: float = 0.0, burst: int = 1):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rps_per_host: Allowed requests per second, keyed by hostname
+            default_rps: Rate for hosts not listed (0 = unlimited)
+            burst: Number of requests a host may make back to back
+        """
+        self.rps_per_host = dict(rps_per_host)
+        self.default_rps = default_rps
+        self.burst = burst
+        self.buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, last refill)
+        self.lock = threading.Lock()
+
+    def acquire(self, host: Optional[str]) -> None:
+        """
+        Block until a request to host is allowed.
+
+        Requests to different hosts never wait on each other.
+
+        Args:
+            host: Hostname the request is going to
+        """
+        rate = self.rps_per_host.get(host, self.default_rps)
+        if not host or rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                tokens, last = self.buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * rate)
+                if tokens >= 1:
+                    self.buckets[host] = (tokens - 1, now)
+                    return
+                self.buckets[host] = (tokens, now)
+                wait = (1 - tokens) / rate
+            time.sleep(wait)
+
+
+# Global rate limiter; unlisted hosts fall back to one request per REQUEST_DELAY
+rate_limiter = HostRateLimiter(
+    settings.REQUEST_RATES,
+    default_rps=1.0 / settings.REQUEST_DELAY if settings.REQUEST_DELAY > 0 else 0.0
+)
@@ -0,0 +1,194 @@
+"""
+Persistent cache for scraper results, keyed by scraper name and JAV ID.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from functools import wraps
+from typing import Dict, Any, Optional, Callable
+from pathlib import Path
+from config.settings import settings
+
+try:
+    import orjson  # Optional: faster (de)serialization of cached results
+except ImportError:
+    orjson = None
+
+# Serializes access to the shared connection from batch worker threads
+_LOCK = threading.Lock()
+
+
+def _dumps(metadata: Dict[str, Any]):
+    """Serialize a result for the payload column (bytes with orjson, str otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(metadata)
+    return json.dumps(metadata, ensure_ascii=False)
+
+
+def _loads(payload) -> Dict[str, Any]:
+    """Parse a payload written by either serializer."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class ScraperCache:
+    """SQLite-backed cache of scraper search results."""
+
+    def __init__(self, cache_file: str = None):
+        """
+        Initialize the scraper cache.
+
+        Args:
+            cache_file: Path to database file (default: scraper_cache.db in the
+                user cache directory, $XDG_CACHE_HOME or ~/.cache)
+        """
+        if not cache_file:
+            cache_dir = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+            cache_file = cache_dir / "jav-nfo-generator" / "scraper_cache.db"
+
+        self.cache_file = Path(cache_file)
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scraper_results ("
+                "scraper TEXT NOT NULL, "
+                "jav_id TEXT NOT NULL, "
+                "fetched_at INTEGER NOT NULL, "
+                "payload TEXT NOT NULL, "
+                "PRIMARY KEY (scraper, jav_id))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, scraper: str, jav_id: str, ttl_hours: float) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result if it is younger than the TTL.
+
+        Args:
+            scraper: Scraper name
+            jav_id: JAV ID that was searched
+            ttl_hours: Maximum age of the entry in hours
+
+        Returns:
+            Cached metadata or None if missing or expired
+        """
+        min_fetched_at = int(time.time() - ttl_hours * 3600)
+        try:
+            with _LOCK:
+                row = self._connect().execute(
+                    "SELECT payload FROM scraper_results "
+                    "WHERE scraper = ? AND jav_id = ? AND fetched_at >= ?",
+                    (scraper, jav_id, min_fetched_at)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read scraper cache: {e}")
+            return None
+
+        if not row:
+            return None
+        try:
+            return _loads(row[0])
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+    def set(self, scraper: str, jav_id: str, metadata: Dict[str, Any]):
+        """
+        Cache a scraper result.
+
+        Args:
+            scraper: Scraper name
+            jav_id: JAV ID that was searched
+            metadata: Metadata dictionary
+        """
+        try:
+            payload = _dumps(metadata)
+        except (TypeError, ValueError):
+            return
+
+        try:
+            with _LOCK:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO scraper_results (scraper, jav_id, fetched_at, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (scraper, jav_id, int(time.time()), payload)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write scraper cache: {e}")
+
+    def clear_cache(self):
+        """Remove all cached scraper results."""
+        try:
+            with _LOCK:
+                conn = self._connect()
+                conn.execute("DELETE FROM scraper_results")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not clear scraper cache: {e}")
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary mapping scraper names to entry counts
+        """
+        try:
+            with _LOCK:
+                rows = self._connect().execute(
+                    "SELECT scraper, COUNT(*) FROM scraper_results GROUP BY scraper"
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return dict(rows)
+
+
+def cached_scrape(ttl_hours: float = 72) -> Callable:
+    """
+    Cache a scraper's search method in the persistent scraper cache.
+
+    Entries are keyed by the scraper's ``cache_key()`` and the JAV code.
+    Only successful (non-empty) results are stored, so failed lookups are
+    retried on the next run. Disabled when CACHE_ENABLED is false; when
+    SCRAPER_CACHE_REFRESH is set, cached entries are ignored and overwritten.
+
+    Args:
+        ttl_hours: How long a cached result stays valid
+
+    Returns:
+        Decorator for ``search(self, jav_code)`` methods
+    """
+    def decorator(search: Callable) -> Callable:
+        @wraps(search)
+        def wrapper(self, jav_code: str):
+            if not settings.CACHE_ENABLED:
+                return search(self, jav_code)
+
+            name = self.cache_key()
+            if not settings.SCRAPER_CACHE_REFRESH:
+                cached = scraper_cache.get(name, jav_code, ttl_hours)
+                if cached is not None:
+                    return cached
+
+            result = search(self, jav_code)
+            if result:
+                scraper_cache.set(name, jav_code, result)
+            return result
+        return wrapper
+    return decorator
+
+
+# Global cache instance
+scraper_cache = ScraperCache(settings.SCRAPER_CACHE_FILE)
@@ -1,19 +1,21 @@
 import requests
 import re
 import os
+import shutil
+import threading
 import time
 from urllib.parse import urljoin
 from typing import List, Optional, Dict
 from config.settings import settings
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.http_session import http_session
 
 
 class SubtitleDownloader:
     """Ultra-fast, parallel subtitle downloader from subtitlecat.com."""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': settings.USER_AGENT})
+        self.session = http_session
         self.base_url = "https://subtitlecat.com/"
 
     def _guess_lang_from_filename(self, filename: str) -> str:
@@ -79,6 +81,7 @@ class SubtitleDownloader:
     def download_subtitle(self, download_url: str, jav_id: str, language: str,
                           output_dir: str = "", video_filename: str = "",
                           metadata: dict = None, source_lang: str = "unknown") -> Optional[str]:
+        tmp_path = None
         try:
             if not output_dir or output_dir == ".":
                 output_dir = getattr(settings, "OUTPUT_DIR_TEMPLATE", "<ID>")
@@ -103,15 +106,26 @@ class SubtitleDownloader:
             filepath = os.path.join(output_dir, subtitle_filename)
 
             if os.path.exists(filepath):
-                return None  # already downloaded
-
-            r = self.session.get(download_url, timeout=settings.REQUEST_TIMEOUT)
-            if r.status_code == 200:
-                with open(filepath, 'wb') as f:
-                    f.write(r.content)
-                return filepath
-            return None
-        except:
+                return None  # already downloaded (only complete files are renamed into place)
+
+            # Stream to a temp file and rename it once the body is complete, so an
+            # interrupted download never leaves a partial .srt that the check above keeps
+            tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.part"
+            with self.session.get(download_url, stream=True, timeout=settings.REQUEST_TIMEOUT) as r:
+                if r.status_code != 200:
+                    return None
+                r.raw.decode_content = True
+                with open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(r.raw, f, 64 * 1024)
+                os.replace(tmp_path, filepath)
+            return filepath
+        except Exception as e:
+            print(f"Error downloading subtitle {download_url}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return None
 
     def download_subtitles_for_jav(self, jav_id: str, output_dir: str = "",
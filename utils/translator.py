@@ -1,8 +1,20 @@
 import requests
-import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from config.settings import settings
 from utils.cache import translation_cache
+from utils.rate_limiter import rate_limiter
+from utils.http_session import http_session
+
+# Batch limits per request: Google's free endpoint takes the text in the URL,
+# DeepL accepts at most 50 texts per call
+_GOOGLE_BATCH_CHARS = 1000
+_DEEPL_BATCH_SIZE = 50
+
+# Requests are paced per host by the shared rate limiter (see REQUEST_RATES)
+_GOOGLE_URL = "https://translate.googleapis.com/translate_a/single"
+_GOOGLE_HOST = "translate.googleapis.com"
+_DEEPL_URL = "https://api-free.deepl.com/v2/translate"
+_DEEPL_HOST = "api-free.deepl.com"
 
 class Translator:
     """Translation utility class."""
@@ -12,7 +24,7 @@ class Translator:
         self.service = settings.TRANSLATION_SERVICE
         self.source_lang = settings.TRANSLATION_SOURCE_LANG
         self.target_lang = settings.TRANSLATION_TARGET_LANG
-        self.session = requests.Session()
+        self.session = http_session
     
     def translate_text(self, text: str, field_type: str = "general") -> Optional[str]:
         """
@@ -61,7 +73,7 @@ class Translator:
         """
         try:
             # Simple Google Translate API call (free tier)
-            url = "https://translate.googleapis.com/translate_a/single"
+            url = _GOOGLE_URL
             params = {
                 'client': 'gtx',
                 'sl': self.source_lang,
@@ -70,6 +82,7 @@ class Translator:
                 'q': text
             }
             
+            rate_limiter.acquire(_GOOGLE_HOST)
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
@@ -103,7 +116,7 @@ class Translator:
             return text
         
         try:
-            url = "https://api-free.deepl.com/v2/translate"
+            url = _DEEPL_URL
             headers = {
                 'Authorization': f'DeepL-Auth-Key {self.api_key}',
                 'Content-Type': 'application/x-www-form-urlencoded'
@@ -114,6 +127,7 @@ class Translator:
                 'target_lang': self.target_lang.upper()
             }
             
+            rate_limiter.acquire(_DEEPL_HOST)
             response = self.session.post(url, headers=headers, data=data, timeout=10)
             response.raise_for_status()
             
@@ -127,13 +141,184 @@ class Translator:
             print(f"DeepL translation failed: {e}")
             return text
     
-    def translate_metadata(self, metadata: Dict[str, Any], force_enable: bool = False) -> Dict[str, Any]:
+    def _translate_google_batch(self, texts: List[str]) -> Optional[List[str]]:
+        """
+        Translate several single-line texts with one Google Translate call.
+        
+        The texts are sent as one newline-separated document and the result
+        is split on the same newlines.
+        
+        Args:
+            texts: Texts to translate, none containing a newline
+            
+        Returns:
+            Translated texts in order, or None if the reply could not be split back
+        """
+        try:
+            url = _GOOGLE_URL
+            params = {
+                'client': 'gtx',
+                'sl': self.source_lang,
+                'tl': self.target_lang,
+                'dt': 't',
+                'q': '\n'.join(texts)
+            }
+            
+            rate_limiter.acquire(_GOOGLE_HOST)
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            
+            data = response.json()
+            if not data or not data[0]:
+                return None
+            translated = ''.join(part[0] for part in data[0] if part[0]).split('\n')
+            if len(translated) != len(texts):
+                return None
+            return [line.strip() for line in translated]
+            
+        except Exception as e:
+            print(f"Google batch translation failed: {e}")
+            return None
+    
+    def _translate_deepl_batch(self, texts: List[str]) -> Optional[List[str]]:
+        """
+        Translate several texts with one DeepL call.
+        
+        Args:
+            texts: Texts to translate
+            
+        Returns:
+            Translated texts in order, or None if failed
+        """
+        if not self.api_key:
+            print("DeepL API key not configured")
+            return None
+        
+        try:
+            url = _DEEPL_URL
+            headers = {
+                'Authorization': f'DeepL-Auth-Key {self.api_key}',
+                'Content-Type': 'application/x-www-form-urlencoded'
+            }
+            data = [('text', text) for text in texts]
+            data.append(('source_lang', self.source_lang.upper()))
+            data.append(('target_lang', self.target_lang.upper()))
+            
+            rate_limiter.acquire(_DEEPL_HOST)
+            response = self.session.post(url, headers=headers, data=data, timeout=10)
+            response.raise_for_status()
+            
+            result = response.json()
+            translations = result.get('translations', []) if result else []
+            if len(translations) != len(texts):
+                return None
+            return [translation['text'] for translation in translations]
+            
+        except Exception as e:
+            print(f"DeepL batch translation failed: {e}")
+            return None
+    
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into groups that fit in one request of the configured service.
+        
+        Args:
+            texts: Texts to translate
+            
+        Returns:
+            List of batches, in order
+        """
+        batches = []
+        current = []
+        size = 0
+        for text in texts:
+            cost = len(text) if self.service == "google" else 1
+            limit = _GOOGLE_BATCH_CHARS if self.service == "google" else _DEEPL_BATCH_SIZE
+            if current and size + cost > limit:
+                batches.append(current)
+                current, size = [], 0
+            current.append(text)
+            size += cost
+        if current:
+            batches.append(current)
+        return batches
+    
+    def translate_many(self, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Translate many texts with as few API requests as possible.
+        
+        Cached texts are answered from the cache; the rest are sent in batches
+        and cached. Texts a batch cannot handle fall back to translate_text.
+        
+        Args:
+            items: (text, field_type) pairs
+            
+        Returns:
+            Translated text for each item, in order
+        """
+        results: List[Optional[str]] = []
+        pending: Dict[Tuple[str, str], List[int]] = {}  # (text, field_type) -> result positions
+        for index, (text, field_type) in enumerate(items):
+            cached = translation_cache.get_cached_translation(text, field_type)
+            results.append(cached or text)
+            if not cached and isinstance(text, str) and text.strip():
+                pending.setdefault((text, field_type), []).append(index)
+        
+        if not pending:
+            return results
+        
+        keys = list(pending)
+        if self.service == "google":
+            # The reply is split on newlines, so multi-line texts are sent alone
+            batchable = [key for key in keys if '\n' not in key[0]]
+        elif self.service == "deepl":
+            batchable = keys
+        else:
+            batchable = []
+        single = [key for key in keys if key not in batchable]
+        
+        translated_texts = {}
+        for batch in self._batches(list(dict.fromkeys(text for text, _ in batchable))):
+            translated = None
+            if len(batch) > 1:
+                if self.service == "google":
+                    translated = self._translate_google_batch(batch)
+                else:
+                    translated = self._translate_deepl_batch(batch)
+            if translated is None:
+                # Lone texts and failed batches go through translate_text instead
+                single.extend(key for key in batchable if key[0] in batch)
+            else:
+                translated_texts.update(zip(batch, translated))
+        
+        for text, field_type in batchable:
+            translated = translated_texts.get(text)
+            if not translated:
+                continue
+            if translated != text:
+                translation_cache.set_cached_translation(text, field_type, translated)
+            for index in pending[(text, field_type)]:
+                results[index] = translated
+        
+        for text, field_type in single:
+            translated = self.translate_text(text, field_type) or text
+            for index in pending[(text, field_type)]:
+                results[index] = translated
+        
+        return results
+    
+    def translate_metadata(self, metadata: Dict[str, Any], force_enable: bool = False,
+                           log: Callable[[str], None] = print) -> Dict[str, Any]:
         """
         Translate metadata fields based on configuration.
         
+        Every uncached text of the record goes through one translate_many
+        call, so the fields share API requests.
+        
         Args:
             metadata: Metadata dictionary to translate
             force_enable: Force translation even if disabled in settings
+            log: Function used to print status lines
             
         Returns:
             Translated metadata dictionary
@@ -141,13 +326,14 @@ class Translator:
         if not settings.TRANSLATION_ENABLED and not force_enable:
             return metadata
         
-        translated_metadata = metadata.copy()
-        
         # Check if R18.dev is set to English mode
         r18dev_english_mode = getattr(settings, 'R18DEV_LANGUAGE', 'jp') == 'en'
-        field_sources = metadata.get('_field_sources', {})
         
+        # Collect every text first so all fields go out together
+        field_sources = metadata.get('_field_sources', {})
         skipped_fields = []
+        fields = []  # (field, original value, kind)
+        pending = []  # (text, field_type) for translate_many
         for field in settings.TRANSLATION_FIELDS:
             field = field.strip()
             if field not in metadata or not metadata[field]:
@@ -162,22 +348,34 @@ class Translator:
 
             # Handle array fields (directors, genres, actresses)
             if field in ['genres', 'directors'] and isinstance(original_value, list):
-                translated_value = self._translate_array(original_value, field)
+                pending.extend((item, field) for item in original_value)
+                fields.append((field, original_value, 'array'))
             elif field in ['actresses', 'actresses_array'] and isinstance(original_value, list):
-                translated_value = self._translate_actress_array(original_value)
+                pending.extend((actress.get("name", ""), "actress") for actress in original_value)
+                fields.append((field, original_value, 'actresses'))
+            else:
+                pending.append((original_value, field))
+                fields.append((field, original_value, 'text'))
+        
+        translations = iter(self.translate_many(pending))
+        translated_metadata = metadata.copy()
+        for field, original_value, kind in fields:
+            if kind == 'array':
+                translated_value = [next(translations) or item for item in original_value]
+            elif kind == 'actresses':
+                translated_value = [
+                    {"name": next(translations) or actress.get("name", ""), "image": actress.get("image", "")}
+                    for actress in original_value
+                ]
             else:
-                translated_value = self.translate_text(original_value, field)
+                translated_value = next(translations)
             
             if translated_value and translated_value != original_value:
                 translated_metadata[field] = translated_value
-                print(f"Translated {field}: {str(original_value)[:20]}... → {str(translated_value)[:30]}...")
-            
-            # Rate limiting for API calls (only if not cached)
-            if isinstance(original_value, str) and not translation_cache.get_cached_translation(original_value, field):
-                time.sleep(0.5)
-            
+                log(f"Translated {field}: {str(original_value)[:20]}... → {str(translated_value)[:30]}...")
+        
         if skipped_fields:
-            print(f"Skipped translation for {', '.join(skipped_fields)}: R18.dev provided English data")
+            log(f"Skipped translation for {', '.join(skipped_fields)}: R18.dev provided English data")
         
         return translated_metadata
 
@@ -185,31 +383,19 @@ class Translator:
         """
         Translate a list of strings (e.g., genres).
         """
-        translated_items = []
-        for item in items:
-            cached = translation_cache.get_cached_translation(item, field_type)
-            if cached:
-                translated_items.append(cached)
-                continue
-            translated = self.translate_text(item, field_type)
-            translated_items.append(translated if translated else item)
-        return translated_items
+        translated = self.translate_many([(item, field_type) for item in items])
+        return [value or item for value, item in zip(translated, items)]
 
     def _translate_actress_array(self, actresses: list) -> list:
         """
         Translate a list of actress dicts (with 'name' and 'image').
         """
-        translated_list = []
-        for actress in actresses:
-            name = actress.get("name", "")
-            image = actress.get("image", "")
-            cached = translation_cache.get_cached_translation(name, "actress")
-            if cached:
-                translated_name = cached
-            else:
-                translated_name = self.translate_text(name, "actress") or name
-            translated_list.append({"name": translated_name, "image": image})
-        return translated_list
+        names = [actress.get("name", "") for actress in actresses]
+        translated = self.translate_many([(name, "actress") for name in names])
+        return [
+            {"name": value or name, "image": actress.get("image", "")}
+            for value, name, actress in zip(translated, names, actresses)
+        ]
 
     def is_enabled(self) -> bool:
         """